@@ -55,6 +55,9 @@ logging options:
 import os
 import subprocess
 import argparse
+import hashlib
+import pickle
+import tempfile
 import getpass
 import sys
 import time
@@ -91,16 +94,25 @@ def clean_exit():
     """
 
     IO.logger.close_logger()
-    exit()
+    sys.exit()
 
 
 # Exit with an error code
-def err_exit(error_code):
+def err_exit(error_code, message=None):
     """Shuts down logger, exits script with error code
+
+    Parameters
+    ----------
+    error_code : int
+        exit code of the script
+    message : str
+        Optional error message written to stderr before exiting
     """
 
+    if message is not None:
+        sys.stderr.write(message + '\n')
     IO.logger.close_logger()
-    exit(error_code)
+    sys.exit(error_code)
 
 
 def create_new_install_config():
@@ -162,7 +174,7 @@ def parse_user_input():
     arguments = vars(parser.parse_args())
 
     if arguments['customconfigure'] is not None:
-        path_to_configure = arguments['customconfigure']
+        path_to_configure = os.path.abspath(arguments['customconfigure'])
 
     # Initialize logging first
     if arguments['printcommands']:
@@ -187,20 +199,15 @@ def parse_user_input():
         print('Updating module versions for configuration {}'.format(
             path_to_configure))
         if not os.path.exists(os.path.join(path_to_configure, 'INSTALL_CONFIG')):
-            print(
-                "**INSTALL_CONFIG file not found in specified directory!**\nAborting...")
-            clean_exit()
-        parser = IO.config_parser.ConfigParser(path_to_configure)
-        install_config, _ = parser.parse_install_config(allow_illegal=True)
+            err_exit(1, '**INSTALL_CONFIG file not found in specified directory!**\nAborting...')
+        install_config, _ = parse_install_config_cached(path_to_configure, None)
         installSynApps.sync_all_module_tags(install_config, path_to_configure)
         print('Done.')
         clean_exit()
 
     elif arguments['updateversions']:
-        print('ERROR - Update versions flag selected but no configure directory given.')
-        print('Rerun with the -c INSTALL_CONFIG_PATH flag')
-        print('Aborting...')
-        err_exit(1)
+        err_exit(1, 'ERROR - Update versions flag selected but no configure directory given.\n'
+                    'Rerun with the -c INSTALL_CONFIG_PATH flag\nAborting...')
 
     return path_to_configure, arguments['buildpath'], arguments
 
@@ -214,16 +221,129 @@ def parse_user_input():
 #                                                                       #
 #########################################################################
 
-def parse_configuration(path_to_configure, yes, force_install_path):
+# Bump when the InstallConfiguration/InstallModule attributes change, so stale pickles are ignored
+CACHE_FORMAT = 2
+PARSE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.epics-install', 'parse_cache')
+# Number of most recently used parsed configurations kept in the cache
+PARSE_CACHE_MAX_ENTRIES = 16
+
+
+def get_configuration_digest(path_to_configure, force_install_path):
+    """Computes a hash of every file in the configure directory along with parse options
+
+    Parameters
+    ----------
+    path_to_configure : str
+        path to the install configuration directory
+    force_install_path : str
+        install location overriding the one in INSTALL_CONFIG, or None
+
+    Returns
+    -------
+    str
+        hex digest identifying the parsed configuration
+    """
+
+    digest = hashlib.blake2b()
+    digest.update('{}|{}|{}|{}|{}'.format(CACHE_FORMAT, installSynApps.__version__, platform,
+                                           path_to_configure, force_install_path).encode('utf-8'))
+    for root, dirs, files in os.walk(path_to_configure):
+        # Skip version control and other hidden directories
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for file in sorted(files):
+            file_path = os.path.join(root, file)
+            digest.update(os.path.relpath(file_path, path_to_configure).encode('utf-8'))
+            with open(file_path, 'rb') as fp:
+                digest.update(fp.read())
+    return digest.hexdigest()
+
+
+def write_parse_cache(cache_file, install_config):
+    """Writes a parsed install configuration to the cache, and removes the least recently used entries
+
+    The pickle is written to a temporary file that is then moved into place, so a concurrent
+    run never reads a partially written cache file.
+
+    Parameters
+    ----------
+    cache_file : str
+        path to the cache file for the parsed configuration
+    install_config : InstallConfiguration
+        parsed install configuration
+    """
+
+    os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=PARSE_CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            pickle.dump(install_config, fp)
+        os.replace(temp_path, cache_file)
+    except Exception:
+        os.remove(temp_path)
+        raise
+
+    entries = [os.path.join(PARSE_CACHE_DIR, file) for file in os.listdir(PARSE_CACHE_DIR) if file.endswith('.pkl')]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for entry in entries[PARSE_CACHE_MAX_ENTRIES:]:
+        os.remove(entry)
+
+
+def parse_install_config_cached(path_to_configure, force_install_path):
+    """Parses the install configuration, reusing a cached result if the configure directory is unchanged
+
+    Parameters
+    ----------
+    path_to_configure : str
+        path to the install configuration directory
+    force_install_path : str
+        install location overriding the one in INSTALL_CONFIG, or None
+
+    Returns
+    -------
+    InstallConfiguration
+        parsed install configuration, or None if parsing failed
+    str
+        None if install location is valid, otherwise message describing the error
+    """
+
+    try:
+        cache_file = os.path.join(PARSE_CACHE_DIR, '{}.pkl'.format(get_configuration_digest(path_to_configure, force_install_path)))
+    except OSError:
+        cache_file = None
+
+    if cache_file is not None and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'rb') as fp:
+                install_config = pickle.load(fp)
+            IO.logger.debug('Loaded parsed install config from cache {}'.format(cache_file))
+            # Mark the entry as recently used, so it is not pruned
+            os.utime(cache_file)
+            # Install location validity depends on the file system, not the configure directory
+            valid, message = install_config.is_install_valid()
+            return install_config, message
+        except Exception:
+            IO.logger.debug('Failed to load cached install config, parsing instead.')
 
-    # Parse base config file, make sure that it is valid - ask for user input until it is valid
     parser = IO.config_parser.ConfigParser(path_to_configure)
     install_config, message = parser.parse_install_config(
         allow_illegal=True, force_location=force_install_path)
+
+    if install_config is not None and cache_file is not None:
+        try:
+            write_parse_cache(cache_file, install_config)
+        except (OSError, pickle.PicklingError):
+            IO.logger.debug('Failed to write install config cache {}'.format(cache_file))
+
+    return install_config, message
+
+
+def parse_configuration(path_to_configure, yes, force_install_path):
+
+    # Parse base config file, make sure that it is valid - ask for user input until it is valid
+    install_config, message = parse_install_config_cached(path_to_configure, force_install_path)
     
     if install_config is None:
-        print('Error parsing Install Config...\n{}'.format(message))
-        exit()
+        err_exit(1, 'Error parsing Install Config...\n{}'.format(message))
     elif message is not None:
         loc_ok = False
     else:
@@ -232,19 +352,7 @@ def parse_configuration(path_to_configure, yes, force_install_path):
             
             if new_loc == 'n':
                 loc = input('Please enter a new install_location > ')
-                install_config.install_location = loc.strip()
-                
-                for module in install_config.get_module_list():
-                    module.abs_path = install_config.convert_path_abs(module.rel_path)
-                    
-                    if module.name == 'EPICS_BASE':
-                        install_config.base_path = module.abs_path
-                    elif module.name == 'SUPPORT':
-                        install_config.support_path = module.abs_path
-                    elif module.name == 'AREA_DETECTOR':
-                        install_config.ad_path = module.abs_path
-                    elif module.name == 'MOTOR':
-                        install_config.motor_path = module.abs_path
+                install_config.relocate(loc.strip())
                 
                 loc_ok = False
             else:
@@ -263,17 +371,7 @@ def parse_configuration(path_to_configure, yes, force_install_path):
                 print('**Permission Error**')
             
             new_path = input('Please enter a new install location > ')
-            install_config.install_location = new_path.strip()
-            
-            for module in install_config.get_module_list():
-                module.abs_path = install_config.convert_path_abs(module.rel_path)
-                
-                if module.name == 'EPICS_BASE':
-                    install_config.base_path = module.abs_path
-                elif module.name == 'SUPPORT':
-                    install_config.support_path = module.abs_path
-                elif module.name == 'AREA_DETECTOR':
-                    install_config.ad_path = module.abs_path
+            install_config.relocate(new_path.strip())
 
     return install_config
 
@@ -284,46 +382,113 @@ def check_deps(builder):
     status, message = builder.check_dependencies_in_path()
 
     if not status:
-        print("** ERROR - could not find {} in environment path - is a dependancy. **".format(message))
-        print("Please install git, make, wget, and tar, and ensure that they are in the system path.")
-        print("Critical dependancy error, abort.")
-        err_exit(2)
+        err_exit(2, '** ERROR - could not find {} in environment path - is a dependancy. **\n'
+                    'Please install git, make, wget, and tar, and ensure that they are in the system path.\n'
+                    'Critical dependancy error, abort.'.format(message))
 
 
 #########################################################################
 #                                                                       #
-# Execute Build Process Here                                            #
+# Collect answers to build prompts                                      #
 #                                                                       #
 #########################################################################
 
-def execute_build(path_to_configure, yes, grab_deps, install_config, cloner, updater, builder, autogenerator):
+class CliAnswers:
+    """Class that stores the answers to the questions asked before the install pipeline runs
+
+    Attributes
+    ----------
+    proceed : bool
+        toggle to run the clone and build process
+    clone : bool
+        toggle to clone and checkout modules
+    install_deps : bool
+        toggle to run the dependency install script
+    build : bool
+        toggle to build the modules
+    create_tarball : bool
+        toggle to create a binary bundle after the build
+    """
+
+    def __init__(self, proceed=True, clone=True, install_deps=False, build=True, create_tarball=True):
+        """Constructor for CliAnswers
+        """
+
+        self.proceed        = proceed
+        self.clone          = clone
+        self.install_deps   = install_deps
+        self.build          = build
+        self.create_tarball = create_tarball
+
+
+def prompt_all(yes, grab_deps, install_config, builder):
+    """Asks all of the build questions back to back, so the pipeline can then run unattended
+
+    Parameters
+    ----------
+    yes : bool
+        if True, no questions are asked, and all steps are run
+    grab_deps : bool
+        if True, the dependency script is run without asking
+    install_config : InstallConfiguration
+        the loaded install configuration
+    builder : BuildDriver
+        the build driver, used to report the number of cores used in compilation
+
+    Returns
+    -------
+    CliAnswers
+        answers to the build questions
+    """
+
+    if yes:
+        return CliAnswers(install_deps=grab_deps)
 
-    # Ask useer to proceed
     print("Ready to start build process with location: {}...".format(install_config.install_location))
-    
-    if not yes:
-        response = input("Proceed? (y/n) > ")
+    if input("Proceed? (y/n) > ") == "n":
+        return CliAnswers(proceed=False, clone=False, build=False, create_tarball=input('Would you like to create a tarball binary bundle now? (y/n) > ') == 'y')
+
+    answers = CliAnswers(install_deps=grab_deps)
+    answers.clone = input("Would you like to clone EPICS and synApps modules? (y/n) > ") == "y"
+    if not grab_deps:
+        answers.install_deps = input('Would you like to run the dependency script to grab dependency packages? (y/n) > ') == 'y'
+
+    # Inform user of number of CPU cores to use and prompt to build
+    if builder.one_thread:
+        num_cores = 'one CPU core'
+    elif builder.threads == 0:
+        num_cores = 'as many CPU cores as possible'
     else:
-        response = "y"
+        num_cores = '{} CPU cores'.format(builder.threads)
+    print('Builder is configured to use {} during compilation...'.format(num_cores))
+    answers.build = input("Build selected modules after clone and update? (y/n) > ") == "y"
+    answers.create_tarball = input('Would you like to create a tarball binary bundle after the build? (y/n) > ') == 'y'
+    print()
+    return answers
+
+
+#########################################################################
+#                                                                       #
+# Execute Build Process Here                                            #
+#                                                                       #
+#########################################################################
+
+def execute_build(path_to_configure, answers, install_config, cloner, updater, builder, autogenerator):
 
-    if response == "n":
+    if not answers.proceed:
         print("Skipping clone + build...")
         return 0
     else:
+        print("Starting build process with location: {}...".format(install_config.install_location))
         print()
 
-        if not yes:
-            clone = input("Would you like to clone EPICS and synApps modules? (y/n) > ")
-        else:
-            clone = "y"
-
         # Run the clone process
-        if clone == "y":
+        if answers.clone:
             
             print("Cloning EPICS and synApps into {}...".format(install_config.install_location))
             print("-" * 45)
             
-            unsuccessful = cloner.clone_and_checkout()
+            unsuccessful = cloner.clone_and_checkout_parallel()
             
             if len(unsuccessful) > 0:
                 for module in unsuccessful:
@@ -349,12 +514,8 @@ def execute_build(path_to_configure, yes, grab_deps, install_config, cloner, upd
         print("-" * 45)
         print("Ready to build EPICS base, support and areaDetector...")
 
-        install_deps = 'n'
-        if not grab_deps and not yes:
-            install_deps = input('Would you like to run the dependency script to grab dependency packages? (y/n) > ')
-        
         # Run external dependency install script.
-        if install_deps == 'y' or (grab_deps):
+        if answers.install_deps:
             print('Attempting to grab external dependencies...')
             if platform == 'win32':
                 dep_script_path = os.path.join(path_to_configure, "dependencyInstall.bat")
@@ -366,22 +527,7 @@ def execute_build(path_to_configure, yes, grab_deps, install_config, cloner, upd
             else:
                 builder.acquire_dependecies(dep_script_path)
 
-        if not yes:
-            # Inform user of number of CPU cores to use and prompt to build
-            if builder.one_thread:
-                num_cores = 'one CPU core'
-            elif builder.threads == 0:
-                num_cores = 'as many CPU cores as possible'
-            else:
-                num_cores = '{} CPU cores'.format(builder.threads)
-            
-            print("-" * 45)
-            print('Builder is configured to use {} during compilation...'.format(num_cores))
-            build = input("Ready to build selected modules... Continue (y/n) > ")
-        else:
-            build = "y"
-
-        if build == "y":
+        if answers.build:
             print("Starting build...")
             # Build all
             ret, failed_list = builder.build_all()
@@ -389,7 +535,9 @@ def execute_build(path_to_configure, yes, grab_deps, install_config, cloner, upd
             if ret != 0:
                 for failed in failed_list:
                     print('Module {} failed to build, will not package'.format(failed))
-                print("**ERROR - {} modules failed to build!!!**".format(len(failed)))
+                    if failed in builder.failure_logs:
+                        IO.logger.log_write('Last lines of build output for {}:\n{}'.format(failed, ''.join(builder.failure_logs[failed])))
+                print("**ERROR - {} modules failed to build!!!**".format(len(failed_list)))
                 print("**Check the INSTALL_CONFIG file to make sure settings and paths are valid**")
                 print('**Critical build error - abort...**')
                 return 4
@@ -416,15 +564,10 @@ def execute_build(path_to_configure, yes, grab_deps, install_config, cloner, upd
 #                                                                       #
 #########################################################################
 
-def generate_bundles(yes, install_config, packager, flat_output, archive, include_src):
+def generate_bundles(yes, answers, install_config, packager, flat_output, archive, include_src):
 
     print()
-    if not yes:
-        create_tarball = input('Would you like to create a tarball binary bundle now? (y/n) > ')
-    else:
-        create_tarball = 'y'
-
-    if create_tarball == 'y':
+    if answers.create_tarball:
         ret_src = 0
         
         # If we want to, include debug bundles
@@ -485,7 +628,7 @@ def execute(yes, grab_deps, flat_output, archive, include_src, configure_path, b
         # Driver Objects for running through build process
         cloner      = DRIVER.clone_driver.CloneDriver(install_config)
         updater     = DRIVER.update_config_driver.UpdateConfigDriver(configure_path, install_config)
-        builder     = DRIVER.build_driver.BuildDriver(install_config, threads, one_thread=single_thread)
+        builder     = DRIVER.build_driver.BuildDriver(install_config, threads, one_thread=single_thread, stream=True)
 
         install_loc = 'DEPLOYMENTS'
         if install_path is not None and os.path.exists(install_path) and os.path.isdir(install_path):
@@ -506,13 +649,16 @@ def execute(yes, grab_deps, flat_output, archive, include_src, configure_path, b
 
         autogenerator = IO.file_generator.FileGenerator(install_config)
 
+        # Ask all questions up front, so the rest of the process runs unattended
+        answers = prompt_all(yes, grab_deps, install_config, builder)
+
         # Run the build
-        build_ret = execute_build(configure_path, yes, grab_deps, install_config, cloner, updater, builder, autogenerator)
+        build_ret = execute_build(configure_path, answers, install_config, cloner, updater, builder, autogenerator)
 
         bundle_ret = 0
         # Generate output bundles
         if build_ret == 0 or build_ret == 1:
-            bundle_ret = generate_bundles(yes, install_config, packager, flat_output, archive, include_src)
+            bundle_ret = generate_bundles(yes, answers, install_config, packager, flat_output, archive, include_src)
 
         # Finished
         return build_ret + bundle_ret
@@ -539,8 +685,7 @@ def main():
     
     # Inclusion of sources only supported in non-flat output mode
     if include_src and (flat_output or not archive):
-         print('Generating source bundles is only supported for non-flat bundles and when outputting archives.\n')
-         err_exit(1)
+        err_exit(1, 'Generating source bundles is only supported for non-flat bundles and when outputting archives.\n')
 
     # Determine how many threads to use for building
     single_thread = False
@@ -563,4 +708,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -6,26 +6,31 @@ This GUI solution allows for much easier use of the installSynApps module
 to clone, update, and build the EPICS and synApps software stack.
 """
 
+import sys
+
 # Tkinter imports
 try:
     import tkinter as tk
-    from tkinter import Label, Button, INSERT, END, W, SUNKEN, Frame, Menu, Tk
+    from tkinter import Label, Button, END, W, SUNKEN, Frame, Menu, Tk
     from tkinter import messagebox
     from tkinter import filedialog
     from tkinter import simpledialog
     from tkinter import font as tkFont
     import tkinter.scrolledtext as ScrolledText
 except ImportError:
-    print('ERROR - TKinter is not installed. Please install tkinter and rerun the application.\n')
-    exit()
+    sys.exit('ERROR - TKinter is not installed. Please install tkinter and rerun the application.\n')
 
 # Some python utility libs
 import os
-import time
+import copy
 import shutil
+import functools
+import tempfile
 import datetime
+import queue
+import collections
 import threading
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 from sys import platform
 
@@ -37,6 +42,51 @@ import installSynApps.driver as DRIVER
 import installSynApps.view_model as VIEW_MODEL
 
 
+# Banner at the top of the log, and in the about message
+LOG_BANNER = installSynApps.get_welcome_text() + '\n'
+
+# Fixed help text shown from the Help menu
+HELP_MESSAGE = ("---------------------------------------------\n"
+                "Welcome to the installSynApps GUI.\nThis program is designed to help you rapidly build EPICS and synApps.\n\n"
+                "To begin, take a look at the panel on the bottom left.\nThis is the currently loaded install configuration.\n"
+                "Note the modules listed to be auto-built and their versions.\n\nTo edit these, check the Edit -> Edit Config tab in the menubar.\n"
+                "A second window should open and allow you to edit the version\nof each module, as well as to select modules to clone/build/package.\n"
+                "This window also allows you to edit the install location.\n\n"
+                "Once you have edited the configuration to your specifications,\nyou may press the autorun button on the side, to trigger the build.\n"
+                "For more detailed documentation on installSynApps, please\nvisit the documentation online.")
+
+# Platform specific dependency script name, and command for launching the initIOCs GUI
+if platform == 'win32':
+    DEPENDENCY_SCRIPT_NAME = 'dependencyInstall.bat'
+    INIT_IOCS_COMMAND = ['py', 'initIOCs.py', '-g']
+else:
+    DEPENDENCY_SCRIPT_NAME = 'dependencyInstall.sh'
+    INIT_IOCS_COMMAND = ['./initIOCs.py', '-g']
+
+# Once the log panel holds more than the max lines, its oldest lines are trimmed. The full log is kept in a file.
+LOG_PANEL_MAX_LINES     = 5000
+LOG_PANEL_TRIM_LINES    = 1000
+
+# Periods of the callbacks scheduled on the Tk main loop, in ms
+LOG_DRAIN_INTERVAL_MS       = 50
+LOADING_INTERVAL_MS         = 250
+METADATA_SAVE_INTERVAL_MS   = 2000
+
+# Frames of the process status animation
+LOADING_LABELS = tuple('Process Thread Status: {}'.format(icon) for icon in ('\\', '|', '/', '-'))
+
+DEPENDENCIES_MESSAGE = ("---------------------------------------------------\n"
+                        "Dependencies required for installSynApps:\n"
+                        " * git\n * wget\n * tar\n * make\n * perl\n\n"
+                        "Also required are a C/C++ compiler:\n"
+                        " * Linux - gcc/g++ (install with package manager)\n"
+                        " * Windows - MSVC/MSVC++ (install with Visual Studio 2015+)\n\n"
+                        "Additional optional python3 modules used, install with pip:\n"
+                        " * distro\n\n"
+                        "All dependencies must be in system path during build time.\n"
+                        "---------------------------------------------------\n")
+
+
 class InstallSynAppsGUI:
     """Class representing GUI for using installSynApps
 
@@ -50,12 +100,29 @@ class InstallSynAppsGUI:
         8 tk buttons linked to control operations
     log and configPanel
         scrollable panels that display current information
-    thread and loadingIconThread
-        threads used for asynchronous usage of the module
+    log_queue
+        queue of pending log messages, drained into the log panel on the Tk main loop
+    parse_cache
+        recently parsed install configurations, keyed by configure path and digest of its contents
+    process_executor and process_future
+        single worker used for asynchronous usage of the module, and the future of the running process
+    loading_after_id
+        id of the scheduled loading animation callback, None if animation is not running
     installSynApps modules
         loaded instances of installSynApps objects that drive the process
     """
 
+    # Edit windows that operate on the loaded install config, keyed on the string passed to openEditWindow
+    EDIT_WINDOWS = {
+        'edit_config':              VIEW_MODEL.edit_install_screen.EditConfigGUI,
+        'add_module':               VIEW_MODEL.add_module_screen.AddModuleGUI,
+        'edit_single_mod':          VIEW_MODEL.edit_individual_module.EditSingleModuleGUI,
+        'edit_injectors':           VIEW_MODEL.edit_injector_screen.EditInjectorGUI,
+        'edit_build_flags':         VIEW_MODEL.edit_macro_screen.EditMacroGUI,
+        'add_custom_build_script':  VIEW_MODEL.add_custom_build_screen.AddCustomBuildScriptGUI,
+        'edit_dependency_script':   VIEW_MODEL.edit_dependency_script.EditDependencyScriptGUI,
+    }
+
     def __init__(self, master):
         """Constructor for InstallSynAppGUI
         """
@@ -68,7 +135,11 @@ class InstallSynAppsGUI:
         frame = Frame(self.master)
         frame.pack()
 
-        # We want log messages to display in the log window.
+        # We want log messages to display in the log window. Messages are queued, since they
+        # are written from the process thread, and drained into the log from the main loop.
+        self.log_queue = queue.Queue()
+        # Popups requested from the process thread, shown from the main loop by drainLog
+        self.popup_queue = queue.Queue()
         IO.logger.assign_write_function(self.writeToLog)
 
         # core count, dependency install, and popups toggles
@@ -93,82 +164,72 @@ class InstallSynAppsGUI:
         self.binariesFlatToggle = tk.BooleanVar()
         self.binariesFlatToggle.set(True)
 
-        # Initialize the menubar
+        # Initialize the menubar. Each menu is a list of entries, where an entry is either a label with a
+        # command, or a label with a boolean variable for a checkbutton
         menubar = Menu(self.master)
-
-        # File menu
-        filemenu = Menu(menubar, tearoff=0)
-        filemenu.add_command(label='New Configuration',         command=lambda : self.openEditWindow('new_config'))
-        filemenu.add_command(label='Open',      command=self.loadConfig)
-        filemenu.add_command(label='Save',      command=self.saveConfig)
-        filemenu.add_command(label='Save As',   command=self.saveConfigAs)
-        filemenu.add_command(label='Sync Tags', command=self.syncTags)
-        filemenu.add_command(label='Exit',      command=self.close_cleanup)
-        menubar.add_cascade(label='File', menu=filemenu)
-
-        # Edit Menu
-        editmenu = Menu(menubar, tearoff=0)
-        editmenu.add_command(label='Edit Config',               command=lambda : self.openEditWindow('edit_config'))
-        editmenu.add_command(label='Add New Module',            command=lambda : self.openEditWindow('add_module'))
-        editmenu.add_command(label='Edit Individual Module',    command=lambda : self.openEditWindow('edit_single_mod'))
-        editmenu.add_command(label='Edit Custom Build Scripts', command=lambda : self.openEditWindow('add_custom_build_script'))
-        editmenu.add_command(label='Edit Injection Files',      command=lambda : self.openEditWindow('edit_injectors'))
-        editmenu.add_command(label='Edit Build Flags',          command=lambda : self.openEditWindow('edit_build_flags'))
-        editmenu.add_command(label='Edit Make Core Count',      command=self.editCoreCount)
-        editmenu.add_checkbutton(label='Toggle Popups',         onvalue=True, offvalue=False, variable=self.showPopups)
-        editmenu.add_checkbutton(label='Toggle Single Core',    onvalue=True, offvalue=False, variable=self.singleCore)
+        menus = [
+            ('File', [
+                ('New Configuration',           functools.partial(self.openEditWindow, 'new_config')),
+                ('Open',                        self.loadConfig),
+                ('Save',                        self.saveConfig),
+                ('Save As',                     self.saveConfigAs),
+                ('Sync Tags',                   self.syncTags),
+                ('Exit',                        self.close_cleanup)]),
+            ('Edit', [
+                ('Edit Config',                 functools.partial(self.openEditWindow, 'edit_config')),
+                ('Add New Module',              functools.partial(self.openEditWindow, 'add_module')),
+                ('Edit Individual Module',      functools.partial(self.openEditWindow, 'edit_single_mod')),
+                ('Edit Custom Build Scripts',   functools.partial(self.openEditWindow, 'add_custom_build_script')),
+                ('Edit Injection Files',        functools.partial(self.openEditWindow, 'edit_injectors')),
+                ('Edit Build Flags',            functools.partial(self.openEditWindow, 'edit_build_flags')),
+                ('Edit Make Core Count',        self.editCoreCount),
+                ('Toggle Popups',               self.showPopups),
+                ('Toggle Single Core',          self.singleCore)]),
+            ('Debug', [
+                ('Print Loaded Config Info',    self.printLoadedConfigInfo),
+                ('Clear Log',                   self.resetLog),
+                ('Recheck Dependancies',        functools.partial(self.recheckDeps, force_recheck=True)),
+                ('Print Path Information',      self.printPathInfo),
+                ('Show Debug Messages',         self.showDebug),
+                ('Show Commands',               self.showCommands),
+                ('Show Package Info When Built', self.showPackageInfo),
+                ('Auto-Generate Log File',      self.generateLogFile)]),
+            ('Build', [
+                ('Autorun',                     functools.partial(self.initBuildProcess, 'autorun')),
+                ('Run Dependency Script',       functools.partial(self.initBuildProcess, 'install-dependencies')),
+                ('Clone Modules',               functools.partial(self.initBuildProcess, 'clone')),
+                ('Update Config Files',         functools.partial(self.initBuildProcess, 'update')),
+                ('Inject into Files',           functools.partial(self.initBuildProcess, 'inject')),
+                ('Build Modules',               functools.partial(self.initBuildProcess, 'build')),
+                ('Edit Dependency Script',      functools.partial(self.openEditWindow, 'edit_dependency_script')),
+                ('Toggle Install Dependencies', self.installDep)]),
+            ('Package', [
+                ('Select Package Destination',  self.selectPackageDestination),
+                ('Package Modules',             functools.partial(self.initBuildProcess, 'package')),
+                ('Copy and Unpack',             self.copyAndUnpack),
+                ('Set Output Pacakge Name',     self.setOutputPackageName),
+                ('Toggle Flat Binaries',        self.binariesFlatToggle)]),
+            ('IOCs', [
+                ('Get initIOCs',                self.getInitIOCs),
+                ('Launch initIOCs',             self.launchInitIOCs)]),
+            ('Help', [
+                ('Quick Help',                  self.loadHelp),
+                ('Required dependencies',       self.printDependencies),
+                ('installSynApps on Github',    functools.partial(self.openWebPage, "https://github.com/epicsNSLS2-deploy/installSynApps")),
+                ('Report an issue',             functools.partial(self.openWebPage, "https://github.com/epicsNSLS2-deploy/installSynApps/issues")),
+                ('Custom Build Script Help',    self.depScriptHelp),
+                ('Online Documentation',        functools.partial(self.openWebPage, "https://epicsNSLS2-deploy.github.io/installSynApps")),
+                ('About',                       self.showAbout)])
+        ]
+        for menu_label, entries in menus:
+            menu = Menu(menubar, tearoff=0)
+            for label, action in entries:
+                if isinstance(action, tk.BooleanVar):
+                    menu.add_checkbutton(label=label, onvalue=True, offvalue=False, variable=action)
+                else:
+                    menu.add_command(label=label, command=action)
+            menubar.add_cascade(label=menu_label, menu=menu)
         self.singleCore.trace('w', self.setSingleCore)
-        menubar.add_cascade(label='Edit', menu=editmenu)
-
-        # Debug Menu
-        debugmenu = Menu(menubar, tearoff = 0)
-        debugmenu.add_command(label='Print Loaded Config Info', command=self.printLoadedConfigInfo)
-        debugmenu.add_command(label='Clear Log',                command=self.resetLog)
-        debugmenu.add_command(label='Recheck Dependancies',     command=self.recheckDeps)
-        debugmenu.add_command(label='Print Path Information',   command=self.printPathInfo)
-        debugmenu.add_checkbutton(label='Show Debug Messages',  onvalue=True, offvalue=False, variable=self.showDebug)
-        debugmenu.add_checkbutton(label='Show Commands',        onvalue=True, offvalue=False, variable=self.showCommands)
-        debugmenu.add_checkbutton(label='Show Package Info When Built', onvalue=True, offvalue=False, variable=self.showPackageInfo)
-        debugmenu.add_checkbutton(label='Auto-Generate Log File',    onvalue=True, offvalue=False, variable=self.generateLogFile)
-        menubar.add_cascade(label='Debug', menu=debugmenu)
-
-        # Build Menu
-        buildmenu = Menu(menubar, tearoff=0)
-        buildmenu.add_command(label='Autorun',                  command=lambda : self.initBuildProcess('autorun'))
-        buildmenu.add_command(label='Run Dependency Script',    command=lambda : self.initBuildProcess('install-dependencies'))
-        buildmenu.add_command(label='Clone Modules',            command=lambda : self.initBuildProcess('clone'))
-        buildmenu.add_command(label='Update Config Files',      command=lambda : self.initBuildProcess('update'))
-        buildmenu.add_command(label='Inject into Files',        command=lambda : self.initBuildProcess('inject'))
-        buildmenu.add_command(label='Build Modules',            command=lambda : self.initBuildProcess('build'))
-        buildmenu.add_command(label='Edit Dependency Script',   command=lambda : self.openEditWindow('edit_dependency_script'))
-        buildmenu.add_checkbutton(label='Toggle Install Dependencies', onvalue=True, offvalue=False, variable=self.installDep)
-        menubar.add_cascade(label='Build', menu=buildmenu)
-
-        # Package Menu
-        packagemenu = Menu(menubar, tearoff=0)
-        packagemenu.add_command(label='Select Package Destination', command=self.selectPackageDestination)
-        packagemenu.add_command(label='Package Modules',            command=lambda : self.initBuildProcess('package'))
-        packagemenu.add_command(label='Copy and Unpack',            command=lambda : self.initBuildProcess('moveunpack'))
-        packagemenu.add_command(label='Set Output Pacakge Name',    command=self.setOutputPackageName)
-        packagemenu.add_checkbutton(label='Toggle Flat Binaries',   onvalue=True, offvalue=False, variable=self.binariesFlatToggle)
-        menubar.add_cascade(label='Package', menu=packagemenu)
-
-        # InitIOCs Menu
-        iocmenu = Menu(menubar, tearoff=0)
-        iocmenu.add_command(label='Get initIOCs', command=self.getInitIOCs)
-        iocmenu.add_command(label='Launch initIOCs', command=self.launchInitIOCs)
-        menubar.add_cascade(label='IOCs', menu=iocmenu)
-
-        # Help Menu
-        helpmenu = Menu(menubar, tearoff=0)
-        helpmenu.add_command(label='Quick Help',                command=self.loadHelp)
-        helpmenu.add_command(label='Required dependencies',     command=self.printDependencies)
-        helpmenu.add_command(label='installSynApps on Github',  command=lambda : webbrowser.open("https://github.com/epicsNSLS2-deploy/installSynApps", new=2))
-        helpmenu.add_command(label='Report an issue',           command=lambda : webbrowser.open("https://github.com/epicsNSLS2-deploy/installSynApps/issues", new=2))
-        helpmenu.add_command(label='Custom Build Script Help',  command=self.depScriptHelp)
-        helpmenu.add_command(label='Online Documentation',      command=lambda : webbrowser.open("https://epicsNSLS2-deploy.github.io/installSynApps", new=2))
-        helpmenu.add_command(label='About',                     command=self.showAbout)
-        menubar.add_cascade(label='Help', menu=helpmenu)
 
         self.master.config(menu=menubar)
 
@@ -179,24 +240,22 @@ class InstallSynAppsGUI:
         self.topLabel       = Label(frame, text = self.msg, width = '40', height = '1', relief = SUNKEN, borderwidth = 1, bg = 'blue', fg = 'white', font = self.largeFont)
         self.topLabel.grid(row = 0, column = 0, padx = 10, pady = 10, columnspan = 2)
 
-        # Control buttons
-        self.loadButton     = Button(frame, font=self.smallFont, text='Load Config',    command=self.loadConfig,                            height='3', width='20')
-        self.cloneButton    = Button(frame, font=self.smallFont, text='Clone Modules',  command=lambda : self.initBuildProcess('clone'),    height='3', width='20')
-        self.updateButton   = Button(frame, font=self.smallFont, text='Update RELEASE', command=lambda : self.initBuildProcess('update'),   height='3', width='20')
-        self.injectButton   = Button(frame, font=self.smallFont, text='Inject Files',   command=lambda : self.initBuildProcess('inject'),   height='3', width='20')
-        self.buildButton    = Button(frame, font=self.smallFont, text='Build Modules',  command=lambda : self.initBuildProcess('build'),    height='3', width='20')
-        self.autorunButton  = Button(frame, font=self.smallFont, text='Autorun',        command=lambda : self.initBuildProcess('autorun'),  height='3', width='20')
-        self.packageButton  = Button(frame, font=self.smallFont, text='Package',        command=lambda : self.initBuildProcess('package'),  height='3', width='20')
-        self.saveLog        = Button(frame, font=self.smallFont, text='Save Log',       command=self.saveLogFunc,                           height='3', width='20')
-
-        self.loadButton.grid(   row = 1, column = 0, padx = 15, pady = 15, columnspan = 1)
-        self.cloneButton.grid(  row = 1, column = 1, padx = 15, pady = 15, columnspan = 1)
-        self.updateButton.grid( row = 2, column = 0, padx = 15, pady = 15, columnspan = 1)
-        self.injectButton.grid( row = 2, column = 1, padx = 15, pady = 15, columnspan = 1)
-        self.buildButton.grid(  row = 3, column = 0, padx = 15, pady = 15, columnspan = 1)
-        self.autorunButton.grid(row = 3, column = 1, padx = 15, pady = 15, columnspan = 1)
-        self.packageButton.grid(row = 4, column = 0, padx = 15, pady = 15, columnspan = 1)
-        self.saveLog.grid(      row = 4, column = 1, padx = 15, pady = 15, columnspan = 1)
+        # Control buttons, stored as attributes with the given names
+        button_opts = {'font' : self.smallFont, 'height' : '3', 'width' : '20'}
+        buttons = [
+            ('loadButton',      'Load Config',      self.loadConfig,                                       1, 0),
+            ('cloneButton',     'Clone Modules',    functools.partial(self.initBuildProcess, 'clone'),     1, 1),
+            ('updateButton',    'Update RELEASE',   functools.partial(self.initBuildProcess, 'update'),    2, 0),
+            ('injectButton',    'Inject Files',     functools.partial(self.initBuildProcess, 'inject'),    2, 1),
+            ('buildButton',     'Build Modules',    functools.partial(self.initBuildProcess, 'build'),     3, 0),
+            ('autorunButton',   'Autorun',          functools.partial(self.initBuildProcess, 'autorun'),   3, 1),
+            ('packageButton',   'Package',          functools.partial(self.initBuildProcess, 'package'),   4, 0),
+            ('saveLog',         'Save Log',         self.saveLogFunc,                                      4, 1)
+        ]
+        for attr_name, text, command, row, column in buttons:
+            button = Button(frame, text=text, command=command, **button_opts)
+            button.grid(row = row, column = column, padx = 15, pady = 15, columnspan = 1)
+            setattr(self, attr_name, button)
 
 
         # Log and loading label
@@ -206,40 +265,64 @@ class InstallSynAppsGUI:
         self.loadingLabel.grid(row = 0, column = 2, pady = 0, columnspan = 2)
 
         # config panel
-        self.configPanel = ScrolledText.ScrolledText(frame, width = '50', height = '20')
+        # Both panels are read only, and are only enabled while their contents are changed
+        self.configPanel = ScrolledText.ScrolledText(frame, width = '50', height = '20', state = 'disabled')
         self.configPanel.grid(row = 5, column = 0, padx = 15, pady = 15, columnspan = 2, rowspan = 2)
+        # Set by updateConfigPanel, the panel is then refreshed on the next log drain
+        self.config_panel_update_pending = False
+
+        # Single worker for async operation, and loading animation state
+        self.process_executor = ThreadPoolExecutor(max_workers=1)
+        self.process_future = None
+        self.loading_after_id = None
+
+        # Every log message is also streamed to a temporary file, so the panel need not hold the whole log
+        self.log_file = tempfile.NamedTemporaryFile('w', prefix='installSynApps_', suffix='.log', delete=False, buffering=1 << 18)
+        # Thread copying the log file to a save location, if a save was started
+        self.log_save_thread = None
 
         # log panel + initialize text
-        self.log = ScrolledText.ScrolledText(frame, height = '40', width = '70')
+        self.log = ScrolledText.ScrolledText(frame, height = '40', width = '70', state = 'disabled')
         self.log.grid(row = 1, column = 2, padx = 15, pady = 15, columnspan = 6, rowspan = 6)
+        # Lines in the log panel, tracked here so flushing the log needs no extra query to Tk
+        self.log_line_count = 1
         self.writeToLog(self.initLogText())
+        self.drainLog()
 
         # No loaded configure path by default
         self.configure_path = None
+        self.dependency_script_path = None
+        self.build_scripts_path = None
         self.valid_install = False
         self.deps_found = True
 
         self.unsaved_changes = False
 
+        # File dialogs reopen wherever the user last selected a path
+        self.last_dialog_dir = os.getcwd()
+
 
         message = None
+        self.parse_cache = collections.OrderedDict()
+        self.config_panel_text = None
+        # Set whenever the install config may have changed, the panel is only rebuilt after that
+        self.config_panel_stale = True
         # Configure metadata, read from existing saved metadata, and load configuration
         self.metacontroller = VIEW_MODEL.meta_pref_control.MetaDataController()
+        self.parser = IO.config_parser.ConfigParser(None)
         if 'configure_path' in self.metacontroller.metadata.keys():
-            self.configure_path = self.metacontroller.metadata['configure_path']
+            self.setConfigurePath(self.metacontroller.metadata['configure_path'])
             self.writeToLog('Loading configure directory saved in location {}\n'.format(self.configure_path))
             # installSynApps options, initialzie + read default configure files
-            self.parser = IO.config_parser.ConfigParser(self.configure_path)
-            self.install_config, message = self.parser.parse_install_config(allow_illegal=True)
+            self.install_config, message = self.parseInstallConfig()
         else:
-            self.parser = IO.config_parser.ConfigParser(None)
             self.writeToLog('Loading default install configuration...\n')
             self.install_config = installSynApps.data_model.install_config.generate_default_install_config()
 
 
-        self.metacontroller.metadata['isa_version'] = installSynApps.__version__
-        self.metacontroller.metadata['platform']    = platform
-        self.metacontroller.metadata['last_used']   = '{}'.format(datetime.datetime.now())
+        self.metacontroller.metadata.update({'isa_version' : installSynApps.__version__,
+                                             'platform'    : platform,
+                                             'last_used'   : datetime.datetime.now().isoformat(' ')})
 
 
         if message is not None:
@@ -248,9 +331,20 @@ class InstallSynAppsGUI:
         else:
             self.valid_install = True
 
-        # Threads for async operation
-        self.thread = threading.Thread()
-        self.loadingIconThread = threading.Thread()
+        # Build process functions, keyed on the action passed to initBuildProcess
+        self.build_processes = {
+            'autorun':              self.autorunProcess,
+            'install-dependencies': self.installDependenciesProcess,
+            'clone':                self.cloneConfigProcess,
+            'update':               self.updateConfigProcess,
+            'inject':               self.injectFilesProcess,
+            'build':                self.buildConfigProcess,
+            'package':              self.packageConfigProcess,
+            'moveunpack':           self.copyAndUnpackProcess,
+        }
+
+        # Location of the initIOCs script, refreshed when it is fetched
+        self.init_iocs_path = self.findInitIOCs()
 
         # installSynApps drivers
         self.writer         = IO.config_writer.ConfigWriter(self.install_config)
@@ -267,8 +361,17 @@ class InstallSynAppsGUI:
         if 'package_output_filename' in self.metacontroller.metadata.keys():
             self.package_output_filename = self.metacontroller.metadata['package_output_filename']
 
+        # Metadata changes are saved periodically, so they are not lost if the GUI does not close cleanly.
+        # Updates are queued, since they may come from the process thread, and applied from the main loop.
+        self.metadata_queue = queue.Queue()
+        self.metadata_changed = True
+        self.saveMetadataLoop()
+
         self.autogenerator  = IO.file_generator.FileGenerator(self.install_config)
 
+        # All objects that hold a reference to the loaded install config
+        self.drivers = (self.writer, self.cloner, self.updater, self.builder, self.packager, self.autogenerator)
+
         # Check for all required dependencies
         self.recheckDeps()
 
@@ -282,67 +385,163 @@ class InstallSynAppsGUI:
 # -------------------------- Helper functions ----------------------------------
 
 
-    def loadingLoop(self):
+    def loadingLoop(self, frame=0):
         """Simple function for playing animation when main process thread is executing
+
+        Reschedules itself on the Tk event loop every 250 ms while a process is running,
+        so the loading label is only ever updated from the main thread.
+
+        Parameters
+        ----------
+        frame : int
+            index of the animation frame to display
+        """
+
+        if self.isProcessRunning():
+            self.loadingLabel.config(text = LOADING_LABELS[frame])
+            self.loading_after_id = self.master.after(LOADING_INTERVAL_MS, self.loadingLoop, (frame + 1) % len(LOADING_LABELS))
+        else:
+            self.loading_after_id = None
+            self.loadingLabel.config(text = 'Process Thread Status: Done.')
+
+
+    def isProcessRunning(self):
+        """Function that checks if a process submitted with startProcess has not yet finished
+
+        Returns
+        -------
+        bool
+            True if a process is running, False otherwise
         """
 
-        icons = ['\\', '|', '/', '-']
-        icon_counter = 0
-        while self.thread.is_alive():
-            self.loadingLabel.config(text = 'Process Thread Status: {}'.format(icons[icon_counter]))
-            time.sleep(0.25)
-            icon_counter = icon_counter + 1
-            if icon_counter == len(icons):
-                icon_counter = 0
-        self.loadingLabel.config(text = 'Process Thread Status: Done.')
+        return self.process_future is not None and not self.process_future.done()
+
+
+    def startProcess(self, target):
+        """Function that runs a process on the process worker, and starts the loading animation if not already running
+
+        Only one process runs at a time. If one is already running, an error is shown instead.
+
+        Parameters
+        ----------
+        target : callable
+            function to run in the process worker
+
+        Returns
+        -------
+        bool
+            True if the process was started, False if another process is still running
+        """
+
+        if self.isProcessRunning():
+            self.showErrorMessage('Start Error', 'ERROR - Process thread is already active.', force_popup=True)
+            return False
+        self.process_future = self.process_executor.submit(target)
+        self.process_future.add_done_callback(self.reportProcessError)
+        if self.loading_after_id is None:
+            self.loadingLoop()
+        return True
+
+
+    def reportProcessError(self, future):
+        """Function called when a process finishes, that writes any exception it raised to the log
+
+        Parameters
+        ----------
+        future : Future
+            future of the finished process
+        """
+
+        if not future.cancelled() and future.exception() is not None:
+            self.writeToLog('ERROR - Process failed with exception: {}\n'.format(future.exception()))
 
 
     def initLogText(self):
         """Function that initializes log text
         """
 
-        return installSynApps.get_welcome_text() + '\n'
+        return LOG_BANNER
 
 
     def resetLog(self):
         """Function that resets the log
         """
 
+        self.flushLog(discard=True)
+        self.log.configure(state = 'normal')
         self.log.delete('1.0', END)
+        self.log.configure(state = 'disabled')
+        self.log_line_count = 1
+        # Saving copies the log file, so it must be cleared along with the panel
+        self.waitForLogSave()
+        self.log_file.seek(0)
+        self.log_file.truncate()
         self.writeToLog(self.initLogText())
 
 
     def updateConfigPanel(self):
+        """Function that requests a refresh of the config panel contents
+
+        The refresh is done by drainLog on the Tk main loop, so this is safe to call from any thread, and
+        several requests made within one drain interval result in a single refresh.
+        """
+
+        self.config_panel_update_pending = True
+
+
+    def refreshConfigPanel(self):
         """Function that refreshes the config panel contents if a new InstallConfiguration is loaded
+
+        Must be called from the Tk main loop. The panel is built in one pass over the modules, and only if updateAllRefs was called since it was last built.
+        It is left as is if its text did not change since it was last written.
         """
 
-        self.configPanel.delete('1.0', END)
-        self.writeToLog("Writing Install Configuration to info panel...\n")
-        if self.install_config is not None:
-            self.writeToConfigPanel("Currently Loaded Install Configuration:\n\n")
-            self.writeToConfigPanel("Install Location: {}\n\n".format(self.install_config.install_location))
-            self.writeToConfigPanel("Modules to auto-build:\n-------------------------------\n")
-            for module in self.install_config.get_module_list():
-                if module.build == "YES":
-                    self.writeToConfigPanel("Name: {},\t\t\tVersion: {}\n".format(module.name, module.version))
-            self.writeToConfigPanel("\nModules with detected custom build scripts:\n----------------------------\n")
-            for module in self.install_config.get_module_list():
-                if module.custom_build_script_path is not None:
-                    self.writeToConfigPanel("Name: {},\t\t\t Version: {}\n".format(module.name, module.version))
-
-            self.writeToConfigPanel("\nModules to clone but not build:\n----------------------------\n")
-            for module in self.install_config.get_module_list():
-                if module.build == "NO" and module.clone == "YES":
-                    self.writeToConfigPanel("Name: {},\t\t\t Version: {}\n".format(module.name, module.version))
-
-            self.writeToConfigPanel("\nModules to package:\n-----------------------------\n")
-            for module in self.install_config.get_module_list():
-                if module.package == "YES":
-                    self.writeToConfigPanel("Name: {},\t\t\t Version: {}\n".format(module.name, module.version))
-
-            self.writeToLog("Done.\n\n")
-        else:
+        if self.install_config is None:
+            self.config_panel_text = None
+            self.config_panel_stale = True
+            self.writeToLog("Writing Install Configuration to info panel...\n")
+            self.writeToConfigPanel('', clear=True)
             self.showErrorMessage("Config Error", "ERROR - Could not display Install Configuration: not loaded correctly")
+            return
+
+        if not self.config_panel_stale:
+            return
+        self.config_panel_stale = False
+
+        # Sort modules into each section in a single pass over the module list
+        build_lines, custom_lines, clone_lines, package_lines = [], [], [], []
+        build_row   = "Name: %s,\t\t\tVersion: %s\n"
+        row         = "Name: %s,\t\t\t Version: %s\n"
+        for module in self.install_config.get_module_list():
+            name_version = (module.name, module.version)
+            build = module.build
+            if build == "YES":
+                build_lines.append(build_row % name_version)
+            elif build == "NO" and module.clone == "YES":
+                clone_lines.append(row % name_version)
+            if module.custom_build_script_path is not None:
+                custom_lines.append(row % name_version)
+            if module.package == "YES":
+                package_lines.append(row % name_version)
+
+        panel_text = ["Currently Loaded Install Configuration:\n\n",
+                      "Install Location: {}\n\n".format(self.install_config.install_location),
+                      "Modules to auto-build:\n-------------------------------\n"]
+        panel_text.extend(build_lines)
+        panel_text.append("\nModules with detected custom build scripts:\n----------------------------\n")
+        panel_text.extend(custom_lines)
+        panel_text.append("\nModules to clone but not build:\n----------------------------\n")
+        panel_text.extend(clone_lines)
+        panel_text.append("\nModules to package:\n-----------------------------\n")
+        panel_text.extend(package_lines)
+        panel_text = ''.join(panel_text)
+        if panel_text == self.config_panel_text:
+            return
+        self.config_panel_text = panel_text
+
+        self.writeToLog("Writing Install Configuration to info panel...\n")
+        self.writeToConfigPanel(panel_text, clear=True)
+        self.writeToLog("Done.\n\n")
 
 
     def updateAllRefs(self, install_config):
@@ -354,23 +553,25 @@ class InstallSynAppsGUI:
             the new install config that was loaded.
         """
 
-        self.install_config             = install_config
-        self.writer.install_config      = self.install_config
-        self.cloner.install_config      = self.install_config
-        self.updater.install_config     = self.install_config
+        self.install_config = install_config
+        self.config_panel_stale = True
+        for driver in self.drivers:
+            driver.install_config = self.install_config
         self.updater.path_to_configure  = self.configure_path
-        self.builder.install_config     = self.install_config
-        self.packager.install_config    = self.install_config
-        self.autogenerator.install_config           = self.install_config
         self.updater.config_injector.install_config = self.install_config
 
 
-    def recheckDeps(self):
+    def recheckDeps(self, force_recheck=False):
         """Wrapper function for checking for installed dependancies
+
+        Parameters
+        ----------
+        force_recheck : bool
+            if True, search the system path again even if it was already checked
         """
 
         self.writeToLog('Checking for installed dependancies...\n')
-        inPath, missing = self.builder.check_dependencies_in_path()
+        inPath, missing = self.builder.check_dependencies_in_path(force_recheck=force_recheck)
         if not inPath:
             self.showErrorMessage('Error', 'ERROR- Could not find {} in system path.'.format(missing), force_popup=True)
             self.deps_found = False
@@ -382,20 +583,70 @@ class InstallSynAppsGUI:
         self.writeToLog('Done.\n')
 
 
+    def updateMetadata(self, values):
+        """Function that queues a metadata update, applied and saved on the next saveMetadataLoop call
+
+        The update is queued, and applied to the metadata from the main loop, so this is safe to call from any thread
+
+        Parameters
+        ----------
+        values : dict
+            metadata keys and their new values
+        """
+
+        self.metadata_queue.put(values)
+
+
+    def applyMetadataUpdates(self):
+        """Function that applies all queued metadata updates. Must be called from the Tk main loop
+        """
+
+        while True:
+            try:
+                values = self.metadata_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.metacontroller.metadata.update(values)
+            self.metadata_changed = True
+
+
+    def saveMetadataLoop(self):
+        """Function that saves changed metadata every 2 seconds from the Tk main loop
+        """
+
+        self.applyMetadataUpdates()
+        if self.metadata_changed:
+            self.metadata_changed = False
+            self.metacontroller.save_metadata()
+        self.metadata_after_id = self.master.after(METADATA_SAVE_INTERVAL_MS, self.saveMetadataLoop)
+
+
     def close_cleanup(self):
         """Function that asks user if he/she wants to close, and cleans up threads, logger, and saves metadata
         """
         
         quit_now = True
-        if self.thread.is_alive():
+        if self.isProcessRunning():
             quit_now = messagebox.askokcancel('Quit?', 'Qutting while process is running may result in invalid installation!')
         
         if self.unsaved_changes and quit_now:
             quit_now = messagebox.askokcancel('Quit?', 'All unsaved Changes will be lost.')
         
         if quit_now:
+            # Stop the periodic callbacks so none of them run against destroyed widgets
+            for after_id in [self.loading_after_id, self.log_after_id, self.metadata_after_id]:
+                if after_id is not None:
+                    self.master.after_cancel(after_id)
             self.master.destroy()
+            self.process_executor.shutdown(wait=False)
             IO.logger.close_logger()
+            self.waitForLogSave()
+            self.log_file.close()
+            try:
+                os.remove(self.log_file.name)
+            except OSError:
+                pass
+            self.applyMetadataUpdates()
             self.metacontroller.save_metadata()
 
 
@@ -405,26 +656,115 @@ class InstallSynAppsGUI:
     def writeToLog(self, text):
         """Function that writes to log
 
+        The text is queued, and written to the log panel by drainLog, so this is safe to call from any thread
+
         Parameters
         ----------
         text : str
             The text to write to the log
         """
 
-        self.log.insert(INSERT, text)
-        self.log.see(END)
+        self.log_queue.put(text)
+
 
+    def flushLog(self, discard=False):
+        """Function that writes all queued messages to the log panel with a single insert
 
-    def writeToConfigPanel(self, text):
+        Must be called from the Tk main loop.
+
+        Parameters
+        ----------
+        discard : bool
+            if True, queued messages are removed without being written
+        """
+
+        pending = []
+        try:
+            while True:
+                pending.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if len(pending) > 0 and not discard:
+            text = ''.join(pending)
+            self.log_file.write(text)
+            # Only scroll along with new output if the log was already showing its end
+            follow_end = self.log.yview()[1] >= 1.0
+            self.log.configure(state = 'normal')
+            self.log.insert(END, text)
+            self.log_line_count = self.log_line_count + text.count('\n')
+            if self.log_line_count > LOG_PANEL_MAX_LINES:
+                trim_lines = self.log_line_count - LOG_PANEL_MAX_LINES + LOG_PANEL_TRIM_LINES
+                self.log.delete('1.0', '{}.0'.format(trim_lines + 1))
+                self.log_line_count = self.log_line_count - trim_lines
+            self.log.configure(state = 'disabled')
+            if follow_end:
+                self.log.see(END)
+
+
+    def drainLog(self):
+        """Function that periodically flushes queued log messages into the log panel, every 50 ms
+
+        Also refreshes the config panel if requested, ends the loading animation as soon as the running
+        process finishes rather than on its next frame, and shows the next popup queued by the process thread.
+        """
+
+        # Scheduled first so that an error below, or a blocking popup, does not stop the log drain
+        self.log_after_id = self.master.after(LOG_DRAIN_INTERVAL_MS, self.drainLog)
+        if self.config_panel_update_pending:
+            self.config_panel_update_pending = False
+            self.refreshConfigPanel()
+        self.flushLog()
+        if self.loading_after_id is not None and not self.isProcessRunning():
+            self.master.after_cancel(self.loading_after_id)
+            self.loadingLoop()
+        # Only one popup is shown per drain
+        try:
+            popup_args = self.popup_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self.showPopup(*popup_args)
+
+
+    def writeToConfigPanel(self, text, clear=False):
         """Function that writes to the config panel
 
         Parameters
         ----------
         text : str
             The text to write to the loaded install config panel
+        clear : bool
+            if True, the existing panel contents are replaced by the text
+        """
+
+        self.configPanel.configure(state = 'normal')
+        if clear:
+            self.configPanel.delete('1.0', END)
+        if len(text) > 0:
+            self.configPanel.insert(END, text)
+        self.configPanel.configure(state = 'disabled')
+
+
+    def askPath(self, dialog, **options):
+        """Function that opens a file dialog starting from the last location the user selected
+
+        Parameters
+        ----------
+        dialog : callable
+            The filedialog function to open, ex. filedialog.askdirectory
+        **options
+            Additional options passed to the dialog
+
+        Returns
+        -------
+        str
+            The selected path, empty if the dialog was cancelled
         """
 
-        self.configPanel.insert(INSERT, text)
+        selected = dialog(initialdir=self.last_dialog_dir, parent=self.master, **options)
+        if len(selected) > 0:
+            self.last_dialog_dir = os.path.dirname(selected) or selected
+        return selected
 
 
     def showErrorMessage(self, title, text, force_popup=False):
@@ -440,8 +780,7 @@ class InstallSynAppsGUI:
             Flag that forces popup even if show popups is set to NO.
         """
 
-        if self.showPopups.get() or force_popup:
-            messagebox.showerror(title, text)
+        self.showPopup(messagebox.showerror, title, text, force_popup)
         self.writeToLog(text + "\n")
 
 
@@ -458,8 +797,7 @@ class InstallSynAppsGUI:
             Flag that forces popup even if show popups is set to NO.
         """
 
-        if self.showPopups.get() or force_popup:
-            messagebox.showwarning(title, text)
+        self.showPopup(messagebox.showwarning, title, text, force_popup)
         self.writeToLog(text + "\n")
 
 
@@ -476,11 +814,34 @@ class InstallSynAppsGUI:
             Flag that forces popup even if show popups is set to NO.
         """
 
-        if self.showPopups.get() or force_popup:
-            messagebox.showinfo(title, text)
+        self.showPopup(messagebox.showinfo, title, text, force_popup)
         self.writeToLog(text + '\n')
 
 
+    def showPopup(self, popup, title, text, force_popup):
+        """Function that shows a message box if popups are enabled or forced
+
+        Tk may only be used from the main loop, so popups requested from the process thread are queued,
+        and shown by drainLog.
+
+        Parameters
+        ----------
+        popup : callable
+            messagebox function used to show the popup, ex. messagebox.showinfo
+        title : str
+            Message title
+        text : str
+            Message text
+        force_popup : bool
+            Flag that forces popup even if show popups is set to NO.
+        """
+
+        if threading.current_thread() is not threading.main_thread():
+            self.popup_queue.put((popup, title, text, force_popup))
+        elif self.showPopups.get() or force_popup:
+            popup(title, text)
+
+
 # ----------------------- Version Sync Functions -----------------------------
 
 
@@ -489,13 +850,7 @@ class InstallSynAppsGUI:
         """Function that automatically updates all of the tags for the install configuration git modules
         """
 
-        if not self.thread.is_alive():
-            self.thread = threading.Thread(target=self.syncTagsProcess)
-            self.loadingIconThread = threading.Thread(target=self.loadingLoop)
-            self.thread.start()
-            self.loadingIconThread.start()
-        else:
-            self.showErrorMessage('Error', 'ERROR - Process thread already running', force_popup=True)
+        self.startProcess(self.syncTagsProcess)
 
 
     def syncTagsProcess(self):
@@ -524,13 +879,7 @@ class InstallSynAppsGUI:
                 return
 
         self.writeToLog("Trying to load new default config with install location {}...\n".format(install_location))
-        if not self.thread.is_alive():
-            self.thread = threading.Thread(target=lambda : self.newConfigProcess(install_location, update_tags))
-            self.loadingIconThread = threading.Thread(target=self.loadingLoop)
-            self.thread.start()
-            self.loadingIconThread.start()
-        else:
-            self.showErrorMessage('Error', 'ERROR - Process thread already running', force_popup=True)
+        self.startProcess(functools.partial(self.newConfigProcess, install_location, update_tags))
 
 
     def newConfigProcess(self, install_loc, update_tags):
@@ -548,6 +897,8 @@ class InstallSynAppsGUI:
         
         valid, err = config.is_install_valid()
 
+        # New configs are not saved anywhere until Save As is used
+        self.setConfigurePath(None)
         if not valid:
             self.showWarningMessage('Warning', 'WARNING - {}'.format(err), force_popup=True)
             self.updateAllRefs(config)
@@ -556,8 +907,6 @@ class InstallSynAppsGUI:
             self.updateAllRefs(config)
             self.updateConfigPanel()
 
-        self.configure_path = None
-
 
     def loadConfig(self):
         """Function that loads a new configure directory
@@ -572,35 +921,86 @@ class InstallSynAppsGUI:
                 return
 
         self.writeToLog("Opening load install config file dialog...\n")
-        temp = self.configure_path
-        self.configure_path = filedialog.askdirectory(initialdir='.')
-        if len(self.configure_path) == 0:
+        new_configure_path = self.askPath(filedialog.askdirectory)
+        if len(new_configure_path) == 0:
             self.writeToLog('Operation cancelled.\n')
-            self.configure_path = temp
             return
-        valid = True
-        if not os.path.exists(self.configure_path + "/INSTALL_CONFIG"):
-            valid = False
+        # Collect the directory contents with a single scandir instead of stat-ing each expected entry
+        try:
+            with os.scandir(new_configure_path) as entries:
+                contents = {entry.name for entry in entries}
+        except OSError:
+            contents = set()
+        if 'INSTALL_CONFIG' not in contents:
             self.showErrorMessage("Config Error", "ERROR - No INSTALL_CONFIG file found in selected directory.")
-        elif not os.path.exists(self.configure_path + "/injectionFiles") or not os.path.exists(self.configure_path + "/macroFiles"):
-            self.showWarningMessage('Load Warning', "WARNING - Could not find injection files or macro files.")
-        if not valid:
-            self.configure_path = temp
             return
+        elif 'injectionFiles' not in contents or 'macroFiles' not in contents:
+            self.showWarningMessage('Load Warning', "WARNING - Could not find injection files or macro files.")
+        self.setConfigurePath(new_configure_path)
         self.writeToLog('Loaded configure directory at {}.\n'.format(self.configure_path))
-        self.parser.configure_path = self.configure_path
-        self.metacontroller.metadata['configure_path'] = self.configure_path
-        self.install_config, message = self.parser.parse_install_config(allow_illegal=True)
+        self.updateMetadata({'configure_path' : self.configure_path})
+        self.install_config, message = self.parseInstallConfig()
         if message is not None:
             self.valid_install = False
             self.showWarningMessage('Warning', 'WARNING - {}.'.format(message), force_popup=True)
         else:
             self.valid_install = True
         if self.install_config is not None:
+            self.updateAllRefs(self.install_config)
             self.updateConfigPanel()
         else:
+            # Processes refuse to start without a loaded config, so the drivers can keep their old references
             self.showErrorMessage('Load error', 'Error loading install config... {}'.format(message), force_popup=True)
-        self.updateAllRefs(self.install_config)
+
+
+    def setConfigurePath(self, configure_path):
+        """Function that sets the configure path used by the GUI and the config parser
+
+        Paths are normalized to absolute paths once here, and paths within the configure directory used by the GUI
+        are built with it. The updater receives the path in updateAllRefs.
+
+        Parameters
+        ----------
+        configure_path : str
+            path to the configure directory, or None if the loaded config is not saved anywhere
+        """
+
+        self.dependency_script_path = None
+        self.build_scripts_path = None
+        if configure_path is not None:
+            configure_path = os.path.abspath(configure_path)
+            self.dependency_script_path = os.path.join(configure_path, DEPENDENCY_SCRIPT_NAME)
+            self.build_scripts_path = os.path.join(configure_path, 'customBuildScripts')
+        self.configure_path = configure_path
+        self.parser.configure_path = configure_path
+
+
+    def parseInstallConfig(self):
+        """Function that parses the install config in the configure path, reusing a recent parse if unchanged
+
+        Returns
+        -------
+        InstallConfiguration
+            parsed install configuration, or None if parsing failed
+        str
+            None if install location is valid, otherwise message describing the error
+        """
+
+        # Keyed on file contents, so saving a config without changes does not force a reparse
+        key = (self.configure_path, self.parser.get_configure_digest())
+        if key in self.parse_cache:
+            self.parse_cache.move_to_end(key)
+            # Configs are edited in place, so always hand out a copy of the cached one
+            install_config = copy.deepcopy(self.parse_cache[key])
+            _, message = install_config.is_install_valid()
+            return install_config, message
+
+        install_config, message = self.parser.parse_install_config(allow_illegal=True)
+        if install_config is not None:
+            self.parse_cache[key] = copy.deepcopy(install_config)
+            if len(self.parse_cache) > 4:
+                self.parse_cache.popitem(last=False)
+        return install_config, message
 
 
     def saveConfig(self):
@@ -628,7 +1028,7 @@ class InstallSynAppsGUI:
             return
         
         if force_loc is None:
-            dirpath = filedialog.asksaveasfilename(initialdir='.')
+            dirpath = self.askPath(filedialog.asksaveasfilename)
             if len(dirpath) < 1:
                 self.writeToLog('Operation Cancelled.\n')
                 return
@@ -640,23 +1040,22 @@ class InstallSynAppsGUI:
             elif not ans:
                 return
             dirpath = force_loc
-            shutil.rmtree(os.path.join(dirpath, 'injectionFiles'))
-            shutil.rmtree(os.path.join(dirpath, 'macroFiles'))
-            os.remove(os.path.join(dirpath, 'INSTALL_CONFIG'))
 
-        wrote, message = self.writer.write_install_config(filepath=dirpath)
+        # The writer clears out old injector and macro files itself, and swaps in the new INSTALL_CONFIG
+        wrote, message = self.writer.write_install_config(filepath=dirpath, overwrite_existing=force_loc is not None)
         if not wrote:
             self.showErrorMessage('Write Error', 'Error saving install config: {}'.format(message), force_popup=True)
         else:
-            if self.configure_path is not None:
-                try:
-                    shutil.copytree(self.configure_path + '/customBuildScripts', dirpath + '/customBuildScripts')
-                except:
-                    pass
-            self.configure_path = dirpath
+            if self.build_scripts_path is not None:
+                if os.path.isdir(self.build_scripts_path) and os.path.abspath(dirpath) != self.configure_path:
+                    try:
+                        installSynApps.copy_tree(self.build_scripts_path, os.path.join(dirpath, 'customBuildScripts'))
+                    except OSError as err:
+                        self.writeToLog('Failed to copy custom build scripts: {}\n'.format(err))
+            self.setConfigurePath(dirpath)
             self.unsaved_changes = False
             self.updateAllRefs(self.install_config)
-            self.metacontroller.metadata['configure_path'] = self.configure_path
+            self.updateMetadata({'configure_path' : self.configure_path})
             self.writeToLog('Saved currently loaded install configuration to {}.\n'.format(dirpath))
 
 
@@ -671,29 +1070,56 @@ class InstallSynAppsGUI:
 
         location = saveDir
         if location == None:
-            location = filedialog.askdirectory(initialdir = '.')
+            location = self.askPath(filedialog.askdirectory)
             if len(location) == 0:
                 return
         if location is not None and not os.path.exists(location):
             self.showErrorMessage('Save Error', 'ERROR - Save directory does not exist')
             return
-        time = datetime.datetime.now()
-        log_file = open(location + "/epics_install_log_" + time.strftime("%Y_%m_%d_%H_%M_%S"), "w")
-        log_file.write(self.log.get('1.0', END))
-        log_file.close()
+        log_name = 'epics_install_log_{}'.format(datetime.datetime.now().strftime('%Y_%m_%d_%H_%M_%S'))
+        # The full log is already streamed to a file, so saving is a file copy, done without blocking the GUI
+        self.flushLog()
+        self.log_file.flush()
+        self.waitForLogSave()
+        self.log_save_thread = threading.Thread(target=self.writeLogFile, args=(os.path.join(location, log_name),))
+        self.log_save_thread.start()
+
+
+    def writeLogFile(self, log_path):
+        """Function that copies the streamed log file to the save location, off of the Tk main loop
+
+        Parameters
+        ----------
+        log_path : str
+            path of the log file to write
+        """
+
+        try:
+            shutil.copyfile(self.log_file.name, log_path)
+        except OSError as err:
+            self.writeToLog('ERROR - Failed to save log to {}: {}\n'.format(log_path, err))
+
+
+    def waitForLogSave(self):
+        """Function that waits for the last log save to finish copying the log file
+        """
+
+        if self.log_save_thread is not None:
+            self.log_save_thread.join()
+            self.log_save_thread = None
 
 
     def selectPackageDestination(self):
         """Function that asks the user to select an output destination for the created tarball
         """
 
-        package_output = filedialog.askdirectory(initialdir = '.', title = 'Select output package directory')
+        package_output = self.askPath(filedialog.askdirectory, title = 'Select output package directory')
         if len(package_output) < 1:
             self.writeToLog('Operation Cancelled.\n')
         else:
             if os.path.exists(package_output):
                 self.packager.output_location = package_output
-                self.metacontroller.metadata['package_location'] = self.packager.output_location
+                self.updateMetadata({'package_location' : self.packager.output_location})
                 self.writeToLog('New package output location set to: {}\n'.format(package_output))
             else:
                 self.showErrorMessage('Path Error', 'ERROR - Output path does not exist.')
@@ -712,12 +1138,37 @@ class InstallSynAppsGUI:
             self.writeToLog('Operation Cancelled.\n')
 
 
+    def findInitIOCs(self):
+        """Function that finds the initIOCs script fetched by getInitIOCs
+
+        Returns
+        -------
+        str
+            absolute path to initIOCs.py, or None if it has not been fetched
+        """
+
+        init_iocs_path = os.path.abspath(os.path.join('initIOC', 'initIOCs.py'))
+        if os.path.isfile(init_iocs_path):
+            return init_iocs_path
+        return None
+
+
     def getInitIOCs(self):
         """Function that gets initIOCs from github.
         """
 
+        self.startProcess(self.getInitIOCsProcess)
+
+
+    def getInitIOCsProcess(self):
+        """Function that clones initIOCs, and waits for the clone to finish before marking it as available
+        """
+
         self.writeToLog('Fetching the initIOC script...\n')
-        _ = subprocess.Popen(['git', 'clone', 'https://github.com/epicsNSLS2-deploy/initIOC'])
+        proc = subprocess.run(['git', 'clone', '--depth=1', 'https://github.com/epicsNSLS2-deploy/initIOC'], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if proc.returncode != 0:
+            self.writeToLog('ERROR - Failed to clone initIOC: {}\n'.format(proc.stderr.decode('utf-8', errors='replace').strip()))
+        self.init_iocs_path = self.findInitIOCs()
         self.writeToLog('Done.\n')
 
 
@@ -725,15 +1176,10 @@ class InstallSynAppsGUI:
         """Function that launches the GUI version of initIOCs
         """
 
-        if os.path.exists('./initIOC/initIOCs.py'):
+        if self.init_iocs_path is not None:
             self.writeToLog('Launching initIOC GUI...\n')
-            current = os.getcwd()
-            os.chdir('initIOC')
-            if platform == 'win32':
-                _ = subprocess.Popen(['py', 'initIOCs.py', '-g'])
-            else:
-                _ = subprocess.Popen(['./initIOCs.py', '-g'])
-            os.chdir(current)
+            init_iocs_dir = os.path.dirname(self.init_iocs_path)
+            _ = subprocess.Popen(INIT_IOCS_COMMAND, cwd=init_iocs_dir)
             self.writeToLog('Done.\n')
         else:
             self.showErrorMessage('Error', 'ERROR - Could not find initIOCs. Run the Get initIOCs command first.')
@@ -751,29 +1197,16 @@ class InstallSynAppsGUI:
             String specifying which edit window to launch
         """
 
-        window = None
-
         if edit_window_str == 'new_config':
             window = VIEW_MODEL.new_config_screen.NewConfigGUI(self)
+        elif edit_window_str not in self.EDIT_WINDOWS:
+            self.showErrorMessage('Open Error', 'ERROR - Illegal Edit Window selection')
+            return
         elif self.install_config is None:
             self.showErrorMessage('Edit Error', 'Error - no loaded install config', force_popup=True)
             return
-        elif edit_window_str == 'edit_config':
-            window = VIEW_MODEL.edit_install_screen.EditConfigGUI(self, self.install_config)
-        elif edit_window_str == 'add_module':
-            window = VIEW_MODEL.add_module_screen.AddModuleGUI(self, self.install_config)
-        elif edit_window_str == 'edit_single_mod':
-            window = VIEW_MODEL.edit_individual_module.EditSingleModuleGUI(self, self.install_config)
-        elif edit_window_str == 'edit_injectors':
-            window = VIEW_MODEL.edit_injector_screen.EditInjectorGUI(self, self.install_config)
-        elif edit_window_str == 'edit_build_flags':
-            window = VIEW_MODEL.edit_macro_screen.EditMacroGUI(self, self.install_config)
-        elif edit_window_str == 'add_custom_build_script':
-            window = VIEW_MODEL.add_custom_build_screen.AddCustomBuildScriptGUI(self, self.install_config)
-        elif edit_window_str == 'edit_dependency_script':
-            window = VIEW_MODEL.edit_dependency_script.EditDependencyScriptGUI(self, self.install_config)
         else:
-            self.showErrorMessage('Open Error', 'ERROR - Illegal Edit Window selection')
+            window = self.EDIT_WINDOWS[edit_window_str](self, self.install_config)
 
         if window is None:
             self.showErrorMessage('Open Error', 'ERROR - Unable to open Edit Window')
@@ -815,31 +1248,29 @@ class InstallSynAppsGUI:
         """Simple function that displays a help message
         """
 
-        helpMessage = "---------------------------------------------\n"
-        helpMessage = helpMessage + "Welcome to the installSynApps GUI.\nThis program is designed to help you rapidly build EPICS and synApps.\n\n"
-        helpMessage = helpMessage + "To begin, take a look at the panel on the bottom left.\nThis is the currently loaded install configuration.\n"
-        helpMessage = helpMessage + "Note the modules listed to be auto-built and their versions.\n\nTo edit these, check the Edit -> Edit Config tab in the menubar.\n"
-        helpMessage = helpMessage + "A second window should open and allow you to edit the version\nof each module, as well as to select modules to clone/build/package.\n"
-        helpMessage = helpMessage + "This window also allows you to edit the install location.\n\n"
-        helpMessage = helpMessage + "Once you have edited the configuration to your specifications,\nyou may press the autorun button on the side, to trigger the build.\n"
-        helpMessage = helpMessage + "For more detailed documentation on installSynApps, please\nvisit the documentation online."
-        self.showMessage("Help", helpMessage)
+        self.showMessage("Help", HELP_MESSAGE)
 
 
     def printDependencies(self):
         """Prints some information regarding required dependencies for installSynApps
         """
 
-        self.writeToLog('---------------------------------------------------\n')
-        self.writeToLog('Dependencies required for installSynApps:\n')
-        self.writeToLog(' * git\n * wget\n * tar\n * make\n * perl\n\n')
-        self.writeToLog('Also required are a C/C++ compiler:\n')
-        self.writeToLog(' * Linux - gcc/g++ (install with package manager)\n')
-        self.writeToLog(' * Windows - MSVC/MSVC++ (install with Visual Studio 2015+)\n\n')
-        self.writeToLog('Additional optional python3 modules used, install with pip:\n')
-        self.writeToLog(' * distro\n\n') 
-        self.writeToLog('All dependencies must be in system path during build time.\n')
-        self.writeToLog('---------------------------------------------------\n')
+        self.writeToLog(DEPENDENCIES_MESSAGE)
+
+
+    def openWebPage(self, url):
+        """Function that opens a web page in a new browser window
+
+        webbrowser is only imported here, as it is slow to import and rarely needed.
+
+        Parameters
+        ----------
+        url : str
+            url of the page to open
+        """
+
+        import webbrowser
+        webbrowser.open(url, new=2)
 
 
     def showAbout(self):
@@ -863,22 +1294,22 @@ class InstallSynAppsGUI:
         """Function that displays help message for adding dependancy script
         """
 
-        self.writeToLog('Use the Edit -> Edit Custom Build Scripts menu to add/remove\n')
-        self.writeToLog('custom build scripts for each module.\nOn windows they will be saved as')
-        self.writeToLog('.bat files, on linux as .sh files,\nand they will be run from the module')
-        self.writeToLog(' root directory.\nIf no custom script is found, the module will just be\n')
-        self.writeToLog('built with make. If you have a sudo call in your script,\nnote that you')
-        self.writeToLog('will need to enter it in the terminal to proceed.\n\n')
+        self.writeToLog('Use the Edit -> Edit Custom Build Scripts menu to add/remove\n'
+                        'custom build scripts for each module.\nOn windows they will be saved as'
+                        '.bat files, on linux as .sh files,\nand they will be run from the module'
+                        ' root directory.\nIf no custom script is found, the module will just be\n'
+                        'built with make. If you have a sudo call in your script,\nnote that you'
+                        'will need to enter it in the terminal to proceed.\n\n')
 
 
     def printPathInfo(self):
         """Function that prints a series of paths that are currently loaded.
         """
 
-        self.writeToLog('-----------------------------------------\n')
-        self.writeToLog('Install Location: {}\n'.format(self.install_config.install_location))
-        self.writeToLog('Install config directory: {}\n'.format(self.configure_path))
-        self.writeToLog('Package output path: {}\n\n'.format(self.packager.output_location))
+        self.writeToLog('-----------------------------------------\n'
+                        'Install Location: {}\n'
+                        'Install config directory: {}\n'
+                        'Package output path: {}\n\n'.format(self.install_config.install_location, self.configure_path, self.packager.output_location))
 
 #--------------------------------- Build Process Functions ------------------------------------------#
 #                                                                                                    #
@@ -887,13 +1318,15 @@ class InstallSynAppsGUI:
 #----------------------------------------------------------------------------------------------------#
 
 
-    def initBuildProcess(self, action):
+    def initBuildProcess(self, action, *args):
         """Event function that starts a thread on the appropriate build process function
 
         Parameters
         ----------
         action : str
             a string key on the async action to perform
+        *args
+            arguments passed to the build process function
         """
 
         if self.generateLogFile.get() and IO.logger._LOG_FILE is None:
@@ -911,30 +1344,10 @@ class InstallSynAppsGUI:
             self.showErrorMessage("Start Error", "ERROR - Loaded install config not valid.", force_popup=True)
         elif not self.deps_found:
             self.showErrorMessage("Start Error", "ERROR - Missing dependancies detected. See Help -> Required Dependencies.", force_popup=True)
-        elif not self.thread.is_alive():
-            if action == 'autorun':
-                self.thread = threading.Thread(target=self.autorunProcess)
-            elif action == 'install-dependencies':
-                self.thread = threading.Thread(target=self.installDependenciesProcess)
-            elif action == 'clone':
-                self.thread = threading.Thread(target=self.cloneConfigProcess)
-            elif action == 'update':
-                self.thread = threading.Thread(target=self.updateConfigProcess)
-            elif action == 'inject':
-                self.thread = threading.Thread(target=self.injectFilesProcess)
-            elif action == 'build':
-                self.thread = threading.Thread(target=self.buildConfigProcess)
-            elif action == 'package':
-                self.thread = threading.Thread(target=self.packageConfigProcess)
-            elif action == 'moveunpack':
-                self.thread = threading.Thread(target=self.copyAndUnpackProcess)
-            else:
-                self.showErrorMessage('Start Error', 'ERROR - Illegal init process call', force_popup=True)
-            self.loadingIconThread = threading.Thread(target=self.loadingLoop)
-            self.thread.start()
-            self.loadingIconThread.start()
+        elif action not in self.build_processes:
+            self.showErrorMessage('Start Error', 'ERROR - Illegal init process call', force_popup=True)
         else:
-            self.showErrorMessage("Start Error", "ERROR - Process thread is already active.")
+            self.startProcess(functools.partial(self.build_processes[action], *args))
 
 
     def installDependenciesProcess(self):
@@ -942,16 +1355,10 @@ class InstallSynAppsGUI:
         """
 
         self.writeToLog('Running dependency script...\n')
-        if platform == 'win32':
-            if os.path.exists(self.configure_path + '/dependencyInstall.bat'):
-                self.builder.acquire_dependecies(self.configure_path + '/dependencyInstall.bat')
-            else:
-                self.writeToLog('No dependency script found.\n')
+        if self.dependency_script_path is not None and os.path.isfile(self.dependency_script_path):
+            self.builder.acquire_dependecies(self.dependency_script_path)
         else:
-            if os.path.exists(self.configure_path + '/dependencyInstall.sh'):
-                self.builder.acquire_dependecies(self.configure_path + '/dependencyInstall.sh')
-            else:
-                self.writeToLog('No dependency script found.\n')
+            self.writeToLog('No dependency script found.\n')
         self.writeToLog('Done.\n')
 
 
@@ -964,10 +1371,9 @@ class InstallSynAppsGUI:
             Return code
         """
 
-        failed = self.cloner.clone_and_checkout()
+        failed = self.cloner.clone_and_checkout_parallel()
         if len(failed) > 0:
-            for elem in failed:
-                self.writeToLog('Module {} was not cloned successfully.\n'.format(elem))
+            self.writeToLog(''.join('Module {} was not cloned successfully.\n'.format(elem) for elem in failed))
             return -1
         return 0
 
@@ -981,12 +1387,11 @@ class InstallSynAppsGUI:
             Return code
         """
         
-        self.writeToLog('----------------------------\n')
-        self.writeToLog('Updating all RELEASE and configuration files...')
+        self.writeToLog('----------------------------\nUpdating all RELEASE and configuration files...')
         self.updater.run_update_config(with_injection=False)
         dep_errors = self.updater.perform_dependency_valid_check()
-        for error in dep_errors:
-            self.writeToLog('{}\n'.format(error))
+        if len(dep_errors) > 0:
+            self.writeToLog(''.join('{}\n'.format(error) for error in dep_errors))
         self.writeToLog('Reordering module build order to account for intra-module dependencies...\n')
         self.updater.perform_fix_out_of_order_dependencies()
         self.writeToLog('Done.\n')
@@ -1022,8 +1427,7 @@ class InstallSynAppsGUI:
         self.writeToLog('Beginning build process...\n')
         status, failed = self.builder.build_all()
         if status != 0:
-            for module in failed:
-                self.writeToLog('Failed building module {}\n'.format(module))
+            self.writeToLog(''.join('Failed building module {}\n'.format(module) for module in failed))
             self.showErrorMessage('Build Error', 'Some modules failed to build.')
         else:
             self.writeToLog('Auto-Build completed successfully.')
@@ -1038,12 +1442,8 @@ class InstallSynAppsGUI:
         self.writeToLog('Done.\n\n')
 
         if self.showPackageInfo.get():
-            readme_fp = open(os.path.join(self.install_config.install_location, 'INSTALL_README.txt'), 'r')
-            readme_info = readme_fp.readlines()
-            readme_fp.close()
-            
-            for line in readme_info:
-                self.writeToLog(line)
+            with open(os.path.join(self.install_config.install_location, 'INSTALL_README.txt'), 'r') as readme_fp:
+                self.writeToLog(readme_fp.read())
 
         return status
 
@@ -1075,8 +1475,7 @@ class InstallSynAppsGUI:
                         self.showErrorMessage('Build Error', 'ERROR - Build error occurred, aborting...')
 
         self.showMessage('Alert', 'You may wish to save a copy of this log file for later use.')
-        self.writeToLog('To generate a bundle from the build, select the Package option.\n')
-        self.writeToLog('Autorun completed.\n')
+        self.writeToLog('To generate a bundle from the build, select the Package option.\nAutorun completed.\n')
 
 
     def packageConfigProcess(self):
@@ -1087,44 +1486,58 @@ class InstallSynAppsGUI:
         self.package_output_filename = self.packager.create_bundle_name()
         output = self.packager.create_package(self.package_output_filename, flat_format=self.binariesFlatToggle.get())
         filename_no_ext = self.package_output_filename
-        self.package_output_filename = self.package_output_filename + '.tgz'
-        self.metacontroller.metadata['package_output_filename'] = self.package_output_filename
+        self.package_output_filename = self.package_output_filename + '.tar.gz'
+        self.updateMetadata({'package_output_filename' : self.package_output_filename})
         if output != 0:
             self.showErrorMessage('Package Error', 'ERROR - Was unable to package areaDetector successfully. Aborting.', force_popup=True)
         else:
             self.writeToLog('Done.\n\n')
 
         if self.showPackageInfo.get():
-            readme_fp = open(os.path.join(self.packager.output_location, 'README_{}.txt'.format(filename_no_ext)), 'r')
-            readme_info = readme_fp.readlines()
-            readme_fp.close()
-            
-            for line in readme_info:
-                self.writeToLog(line)
+            with open(os.path.join(self.packager.output_location, 'README_{}.txt'.format(filename_no_ext)), 'r') as readme_fp:
+                self.writeToLog(readme_fp.read())
 
 
-    def copyAndUnpackProcess(self):
+    def copyAndUnpack(self):
         """Function that allows user to move their packaged tarball and unpack it.
+
+        The target directory is selected here, on the main loop, and the unpacking is done by the process thread.
         """
 
         self.writeToLog('Starting move + unpack operation...\n')
         if self.package_output_filename is None:
             self.showErrorMessage('Error', 'ERROR - No tarball package has yet been created.')
-        elif not os.path.exists(self.packager.output_location + '/' + self.package_output_filename):
+            return
+        tarball = os.path.join(self.packager.output_location, self.package_output_filename)
+        if not os.path.exists(tarball):
             self.showErrorMessage('Error', 'ERROR - tarball was generated but could not be found. Possibly moved.')
         else:
-            target = filedialog.askdirectory(initialdir='.')
-            if target is None:
+            target = self.askPath(filedialog.askdirectory)
+            if len(target) == 0:
                 self.writeToLog('Operation cancelled.\n')
             else:
-                self.writeToLog('Moving and unpacking to: {}\n'.format(target))
-                shutil.move(os.path.join(self.packager.output_location, self.package_output_filename), os.path.join(target, self.package_output_filename))
-                current = os.getcwd()
-                os.chdir(target)
-                subprocess.call(['tar', '-xzf', self.package_output_filename])
-                os.remove(self.package_output_filename)
-                os.chdir(current)
-                self.writeToLog('Done.')
+                self.initBuildProcess('moveunpack', tarball, target)
+
+
+    def copyAndUnpackProcess(self, tarball, target):
+        """Function that unpacks the packaged tarball into the target directory, and removes the tarball
+
+        Parameters
+        ----------
+        tarball : str
+            path to the packaged tarball
+        target : str
+            directory into which the tarball is unpacked
+        """
+
+        self.writeToLog('Moving and unpacking to: {}\n'.format(target))
+        # Stream the tarball straight into the target rather than moving it there and shelling out to tar.
+        # tarfile is only imported here, as unpacking is rarely used.
+        import tarfile
+        with tarfile.open(tarball, 'r|gz', bufsize=1 << 20) as tar:
+            tar.extractall(target)
+        os.remove(tarball)
+        self.writeToLog('Done.\n')
         
 
 
@@ -1147,4 +1560,4 @@ if __name__ == '__main__':
         main()
     except KeyboardInterrupt:
         print('Exiting...\n')
-        exit()
+        sys.exit()
@@ -7,10 +7,12 @@ clone build and package specified modules.
 import sys
 import re
 import os
+import shutil
 from sys import platform
 import datetime
 import subprocess
 from subprocess import Popen, PIPE
+from concurrent.futures import ThreadPoolExecutor
 import installSynApps.io.logger as LOG
 import installSynApps.io as IO
 import re
@@ -33,12 +35,23 @@ else:
 # Ex. Calc version R3-7-3 is most recent, but R5-* exists?
 update_tags_blacklist = ["SSCAN", "CALC", "STREAM"]
 
+# Separates the numbers in module versions and tag names
+VERSION_SEPARATOR_RE = re.compile(r'\D+')
+
 # Module version, author, copyright
 __version__     = "R2-7"
 __author__      = "Jakub Wlodek"
 __copyright__   = "Copyright (c) Brookhaven National Laboratory 2018-2020"
 __environment__ = "Python Version: {}, OS Class: {}".format(sys.version.split()[0], OS_class)
 
+# Welcome banner, formatted once since its contents are fixed
+WELCOME_TEXT = ("+----------------------------------------------------------------+\n"
+                "+ epics-install, Version: {:<39}+\n"
+                "+ {:<63}+\n"
+                "+ {:<63}+\n"
+                "+ This software comes with NO warranty!                          +\n"
+                "+----------------------------------------------------------------+\n").format(__version__, __environment__, __copyright__)
+
 
 def find_isa_version():
     """Function that attempts to get the version of installSynApps used.
@@ -94,13 +107,7 @@ def get_welcome_text():
         the welcome message
     """
 
-    text = "+----------------------------------------------------------------+\n"
-    text = text + "+ epics-install, Version: {:<39}+\n".format(__version__)
-    text = text + "+ {:<63}+\n".format(__environment__)
-    text = text + "+ {:<63}+\n".format(__copyright__)
-    text = text + "+ This software comes with NO warranty!                          +\n"
-    text = text + "+----------------------------------------------------------------+\n"
-    return text
+    return WELCOME_TEXT
 
 
 def join_path(*args):
@@ -109,20 +116,159 @@ def join_path(*args):
     All paths use / instead of \\ for simplicity.
     """
 
-    output_path = ''
-    first = True
+    parts = []
     for arg in args:
-        temp = arg.strip()
-        temp = temp.replace('\\', '/')
+        temp = arg.strip().replace('\\', '/')
         if temp.endswith('/'):
             temp = temp[:-1]
-        if first:
-            first = False
-        else:
-            output_path += '/'
-        output_path += temp
+        parts.append(temp)
+
+    return '/'.join(parts)
+
+
+def copy_tree(src, dest):
+    """Function that recursively copies the contents of one directory into another
+
+    Unlike shutil.copytree, the destination may already exist, and files already present in it are
+    left untouched. Directory entries are read with a single os.scandir pass, so the type of each
+    entry comes from the cached DirEntry rather than a separate stat call. On windows, robocopy is used.
+
+    Parameters
+    ----------
+    src : str
+        Path to the directory to copy
+    dest : str
+        Path to the directory into which to copy
+    """
+
+    if platform == 'win32':
+        # robocopy exit codes below 8 indicate success
+        proc = subprocess.run(['robocopy', src, dest, '/S', '/NFL', '/NDL', '/NJH', '/NJS'], stdout=subprocess.DEVNULL)
+        if proc.returncode >= 8:
+            raise OSError('robocopy failed to copy {} to {}'.format(src, dest))
+        return
+
+    os.makedirs(dest, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dest, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                copy_tree(entry.path, target)
+            elif not os.path.lexists(target):
+                shutil.copy2(entry.path, target, follow_symlinks=False)
+
+
+def remove_tree(path):
+    """Function that recursively removes a directory and all of its contents
+
+    Each directory is listed once with os.scandir, and the cached DirEntry type is used to decide
+    whether to recurse or unlink. A path that does not exist is ignored.
+
+    Parameters
+    ----------
+    path : str
+        Path to the directory to remove
+    """
+
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def can_sync_module_tag(module):
+    """Function that checks if a module's version can be synced with its git tags
+
+    Parameters
+    ----------
+    module : InstallModule
+        The module to check
+
+    Returns
+    -------
+    bool
+        True if module is hosted with git, is not on master, and is not blacklisted
+    """
 
-    return output_path
+    return module.url_type == 'GIT_URL' and module.version != 'master' and module.name not in update_tags_blacklist
+
+
+def get_module_tags(module):
+    """Function that gets the names of all tags in a module's git repository
+
+    Only the tag refs themselves are listed, without the peeled ^{} entries of annotated tags.
+
+    Parameters
+    ----------
+    module : InstallModule
+        The module for which to get tags
+
+    Returns
+    -------
+    list of str
+        Names of all tags found in the remote repository
+    """
+
+    account_repo = '{}{}'.format(module.url, module.repository)
+    LOG.print_command("git ls-remote --tags --refs {}".format(account_repo))
+    sync_tags_proc = Popen(['git', 'ls-remote', '--tags', '--refs', account_repo], stdout=PIPE, stderr=PIPE)
+    out, _ = sync_tags_proc.communicate()
+    return [tag.rsplit('/')[-1] for tag in out.decode('utf-8').splitlines()]
+
+
+def get_version_numbers(version):
+    """Function that extracts the numbers in a version string, ex. R6-2-1 gives [6, 2, 1]
+
+    Parameters
+    ----------
+    version : str
+        version or tag name
+
+    Returns
+    -------
+    list of int
+        the numbers found in the version string, in order
+    """
+
+    return [int(num) for num in VERSION_SEPARATOR_RE.split(version) if num.isnumeric()]
+
+
+def update_module_version(module, tags):
+    """Function that updates a module's version to the newest of the given tags, if it is newer
+
+    Parameters
+    ----------
+    module : InstallModule
+        The module to update
+    tags : list of str
+        Names of the tags in the module's repository
+    """
+
+    if len(tags) > 0:
+
+        # Tags starting with R are preferred, otherwise the tag with the highest version numbers is chosen
+        best_tag = tags[0]
+        best_tag_version_numbers = get_version_numbers(best_tag)
+        for tag in tags:
+            tag_version_numbers = get_version_numbers(tag)
+            if len(tag_version_numbers) == 0 or (best_tag.startswith('R') and not tag.startswith('R')):
+                continue
+            if (tag.startswith('R') and not best_tag.startswith('R')) or tag_version_numbers > best_tag_version_numbers:
+                best_tag = tag
+                best_tag_version_numbers = tag_version_numbers
+
+        if best_tag_version_numbers > get_version_numbers(module.version):
+            LOG.write('Updating {} from version {} to version {}'.format(module.name, module.version, best_tag))
+            module.version = best_tag
+        else:
+            LOG.debug('Module {} already at latest version: {}'.format(module.name, module.version))
 
 
 def sync_module_tag(module_name, install_config, save_path = None):
@@ -141,55 +287,8 @@ def sync_module_tag(module_name, install_config, save_path = None):
     """
 
     module = install_config.get_module_by_name(module_name)
-    if module.url_type == 'GIT_URL' and module.version != 'master' and module.name not in update_tags_blacklist:
-        account_repo = '{}{}'.format(module.url, module.repository)
-        LOG.print_command("git ls-remote --tags {}".format(account_repo))
-        sync_tags_proc = Popen(['git', 'ls-remote', '--tags', account_repo], stdout=PIPE, stderr=PIPE)
-        out, _ = sync_tags_proc.communicate()
-        ret = out.decode('utf-8')
-        tags_temp = ret.splitlines()
-        tags = []
-        for tag in tags_temp:
-            tags.append(tag.rsplit('/')[-1])
-
-        if len(tags) > 0:
-
-            best_tag = tags[0]
-            best_tag_ver_str_list = re.split(r'\D+', tags[0])
-            best_tag_ver_str_list = [num for num in best_tag_ver_str_list if num.isnumeric()]
-            best_tag_version_numbers = list(map(int, best_tag_ver_str_list))
-            for tag in tags:
-                tag_ver_str_list = re.split(r'\D+', tag)
-                tag_ver_str_list = [num for num in tag_ver_str_list if num.isnumeric()]
-                tag_version_numbers = list(map(int, tag_ver_str_list))
-                for i in range(len(tag_version_numbers)):
-                    if best_tag.startswith('R') and not tag.startswith('R'):
-                        break
-                    elif not best_tag.startswith('R') and tag.startswith('R'):
-                        best_tag = tag
-                        best_tag_version_numbers = tag_version_numbers
-                        break
-                    elif i == len(best_tag_version_numbers) or tag_version_numbers[i] > best_tag_version_numbers[i]:
-                        best_tag = tag
-                        best_tag_version_numbers = tag_version_numbers
-                        break
-                    elif tag_version_numbers[i] < best_tag_version_numbers[i]:
-                        break
-
-            tag_updated = False
-            module_ver_str_list = re.split(r'\D+', module.version)
-            module_ver_str_list = [num for num in module_ver_str_list if num.isnumeric()]
-            module_version_numbers = list(map(int, module_ver_str_list))
-            for i in range(len(best_tag_version_numbers)):
-                if i == len(module_version_numbers) or best_tag_version_numbers[i] > module_version_numbers[i]:
-                    tag_updated = True
-                    LOG.write('Updating {} from version {} to version {}'.format(module.name, module.version, best_tag))
-                    module.version = best_tag
-                    break
-                elif best_tag_version_numbers[i] < module_version_numbers[i]:
-                    break
-            if not tag_updated:
-                LOG.debug('Module {} already at latest version: {}'.format(module.name, module.version))
+    if can_sync_module_tag(module):
+        update_module_version(module, get_module_tags(module))
 
     if save_path is not None:
         writer = IO.config_writer.ConfigWriter(install_config)
@@ -200,9 +299,12 @@ def sync_module_tag(module_name, install_config, save_path = None):
         return True
 
 
-def sync_all_module_tags(install_config, save_path=None, overwrite_existing=True):
+def sync_all_module_tags(install_config, save_path=None, overwrite_existing=True, max_workers=8):
     """Function that syncs module version tags with those found in git repositories.
 
+    Tags for all modules are fetched concurrently, since each fetch waits on the network,
+    and module versions are then updated in install config order.
+
     Parameters
     ----------
     install_config : InstallConfiguration
@@ -211,12 +313,20 @@ def sync_all_module_tags(install_config, save_path=None, overwrite_existing=True
         None by default. If set, will save the install configuration to the given location after updating.
     overwrite_existing : bool
         Flag that tells installSynApps to overwrite or not the existing module tags. Default: True
+    max_workers : int
+        Maximum number of repositories queried at the same time. Default: 8
     """
 
     LOG.write('Syncing...')
     LOG.write('Please wait while tags are synced - this may take a while...')
-    for module in install_config.get_module_list():
-        sync_module_tag(module.name, install_config)
+    to_sync = [module for module in install_config.get_module_list() if can_sync_module_tag(module)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(get_module_tags, module) for module in to_sync]
+        for module, future in zip(to_sync, futures):
+            try:
+                update_module_version(module, future.result())
+            except Exception as e:
+                LOG.write('Failed to sync tags for module {}: {}'.format(module.name, str(e)))
 
     if save_path is not None:
         writer = IO.config_writer.ConfigWriter(install_config)
@@ -43,6 +43,8 @@ class InstallConfiguration:
         list of injector files loaded by install configuration
     build_flags : list of list of str
         list of macro-value pairs enforced at build time
+    abs_path_cache : dict of str -> str
+        cache of relative paths already resolved by convert_path_abs
     """
 
 
@@ -70,6 +72,9 @@ class InstallConfiguration:
         self.motor_path     = None
         self.extensions_path = None
 
+        # Resolved relative paths, cleared whenever the key paths above move
+        self.abs_path_cache = {}
+
     
     def is_install_valid(self):
         """Function that checks if given install location is valid
@@ -123,21 +128,61 @@ class InstallConfiguration:
             module.abs_path = self.convert_path_abs(module.rel_path)
 
             # Key paths to track
-            if module.name == "EPICS_BASE":
-                self.base_path = module.abs_path
-            elif module.name == "SUPPORT":
-                self.support_path = module.abs_path
-            elif module.name == "AREA_DETECTOR":
-                self.ad_path = module.abs_path
-            elif module.name == "MOTOR":
-                self.motor_path = module.abs_path
-            elif module.name == "EXTENSIONS":
-                self.extensions_path = module.abs_path
+            self.update_key_path(module)
             
             self.module_map[module.name] = len(self.modules)
             self.modules.append(module)
 
 
+    def update_key_path(self, module):
+        """Function that updates the tracked key paths if module is one of the key modules
+
+        Moving a key path invalidates the cached absolute paths that were resolved against it.
+
+        Parameters
+        ----------
+        module : InstallModule
+            module with an up to date absolute path
+        """
+
+        if module.name == "EPICS_BASE":
+            self.base_path = module.abs_path
+        elif module.name == "SUPPORT":
+            self.support_path = module.abs_path
+        elif module.name == "AREA_DETECTOR":
+            self.ad_path = module.abs_path
+        elif module.name == "MOTOR":
+            self.motor_path = module.abs_path
+        elif module.name == "EXTENSIONS":
+            self.extensions_path = module.abs_path
+        else:
+            return
+        self.abs_path_cache.clear()
+
+
+    def relocate(self, install_location):
+        """Function that moves the install configuration to a new install location
+
+        The key paths are recomputed first, so that no module is resolved against a key path
+        that has not moved yet. The absolute path cache is then cleared once, and the absolute
+        path of each module is recomputed.
+
+        Parameters
+        ----------
+        install_location : str
+            path to new top level install location
+        """
+
+        self.install_location = install_location
+        for module in self.modules:
+            if module.name in ["EPICS_BASE", "SUPPORT", "AREA_DETECTOR", "MOTOR", "EXTENSIONS"]:
+                module.abs_path = self.resolve_path_macros(module.rel_path)
+                self.update_key_path(module)
+        self.abs_path_cache.clear()
+        for module in self.modules:
+            module.abs_path = self.convert_path_abs(module.rel_path)
+
+
     def add_injector_file(self, name, contents, target):
         """Function that adds a new injector file to the install_config object
         
@@ -257,7 +302,8 @@ class InstallConfiguration:
     def convert_path_abs(self, rel_path):
         """Function that converts a given modules relative path to an absolute path
 
-        If the macro name can be found in the list of accounted for modules, replace it with that module's absolute path
+        If the macro name can be found in the list of accounted for modules, replace it with that module's absolute path.
+        Resolved paths are cached until the install location or one of the key paths changes.
 
         Parameters
         ----------
@@ -270,6 +316,29 @@ class InstallConfiguration:
             The absolute installation path for the module. (Macros are replaced)
         """
 
+        abs_path = self.abs_path_cache.get(rel_path)
+        if abs_path is None:
+            abs_path = self.resolve_path_macros(rel_path)
+            # Only cache resolved paths, unresolved ones may resolve once more modules are added
+            if abs_path != rel_path:
+                self.abs_path_cache[rel_path] = abs_path
+        return abs_path
+
+
+    def resolve_path_macros(self, rel_path):
+        """Function that replaces the macro at the start of a relative path with the matching absolute path
+
+        Parameters
+        ----------
+        rel_path : str
+            The relative installation path for the given module
+
+        Returns
+        -------
+        str
+            The absolute installation path, or rel_path if the macro could not be resolved
+        """
+
         temp = rel_path.split('/', 1)[-1]
         if "$(INSTALL)" in rel_path and self.install_location != None:
             return installSynApps.join_path(self.install_location, temp)
@@ -319,13 +388,11 @@ class InstallConfiguration:
             A string representing the install configuration
         """
 
-        out = "--------------------------------\n"
-        out = out + "Install Location = {}\n".format(self.install_location)
-        out = out + "This Install Config is saved at {}\n".format(self.path_to_configure)
-        for module in self.modules:
-            if module.clone == 'YES':
-                out = out + module.get_printable_string()
-        return out
+        out = ["--------------------------------\n",
+               "Install Location = {}\n".format(self.install_location),
+               "This Install Config is saved at {}\n".format(self.path_to_configure)]
+        out.extend(module.get_printable_string() for module in self.modules if module.clone == 'YES')
+        return ''.join(out)
 
 
     def get_module_names_list(self):
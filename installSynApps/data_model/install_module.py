@@ -93,10 +93,11 @@ class InstallModule:
             A string representation of the install module
         """
 
-        out = "-----------------------------------------\n"
-        out = out + "Module: {}, Version: {}\n".format(self.name, self.version)
-        out = out + "Install Location Abs: {}\n".format(self.abs_path)
-        out = out + "Install Location Rel: {}\n".format(self.rel_path)
-        out = out + "Repository: {}{} w/ Type: {}\n".format(self.url, self.repository, self.url_type)
-        out = out + "Clone: {}, Build: {}, Package: {}\n".format(self.clone, self.build, self.package)
-        return out
\ No newline at end of file
+        return ("-----------------------------------------\n"
+                "Module: {}, Version: {}\n"
+                "Install Location Abs: {}\n"
+                "Install Location Rel: {}\n"
+                "Repository: {}{} w/ Type: {}\n"
+                "Clone: {}, Build: {}, Package: {}\n").format(self.name, self.version, self.abs_path, self.rel_path,
+                                                             self.url, self.repository, self.url_type,
+                                                             self.clone, self.build, self.package)
\ No newline at end of file
@@ -6,21 +6,26 @@ acquiring and checking dependencies.
 
 # Standard libs
 import os
+import re
+from collections import deque
 from subprocess import Popen, PIPE, STDOUT
-import subprocess
+import shutil
+import importlib.util
 from sys import platform
 import sys
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-WITHOUT_REQUESTS = False
-try:
-    import requests
-except ImportError:
-    WITHOUT_REQUESTS = True
+# Only check that requests is available, without paying for importing it
+WITHOUT_REQUESTS = importlib.util.find_spec('requests') is None
 
 # Logger import
 import installSynApps.io.logger as LOG
 
 
+# Matches single package manager install lines in dependency scripts, ex. sudo apt-get -y install gcc
+PACKAGE_INSTALL_RE = re.compile(r'^((?:sudo\s+)?(?:apt-get|apt|yum|dnf)\s+(?:-y\s+)?install(?:\s+-y)?)\s+([\w.+:\-]+(?:\s+[\w.+:\-]+)*)$')
+
+
 class BuildDriver:
     """Class responsible for driving the autobuilding of EPICS, synApps, and areaDetector
 
@@ -36,19 +41,31 @@ class BuildDriver:
         make flag to use for compilation (-s, -sj, -sjNUM_THREADS)
     built : list of str
         list of modules built successfully
+    stream : bool
+        toggle to pipe build output through python, keeping a tail of it for failed modules
+    failure_logs : dict of str -> list of str
+        last lines of build output for each module that failed to build, populated when streaming
+    dependency_check_cache : dict of str -> (bool, str)
+        results of check_dependencies_in_path for each value of PATH
     """
 
-    def __init__(self, install_config, threads, one_thread=False):
+    # Number of output lines kept for reporting a failed build when streaming
+    FAILURE_TAIL_LENGTH = 2000
+
+    def __init__(self, install_config, threads, one_thread=False, stream=False):
         """Constructor for BuildDriver
         """
 
         self.install_config = install_config
         self.threads = threads
         self.one_thread = one_thread
+        self.stream = stream
+        self.failure_logs = {}
+        self.dependency_check_cache = {}
         self.make_flag = '-sj'
         self.create_make_flags()
         self.built = []
-        self.non_build_packages = ["SUPPORT", "CONFIGURE", "UTILS", "DOCUMENTATION", "AREA_DETECTOR"]
+        self.non_build_packages = frozenset(["SUPPORT", "CONFIGURE", "UTILS", "DOCUMENTATION", "AREA_DETECTOR"])
 
 
     def create_make_flags(self):
@@ -65,9 +82,16 @@ class BuildDriver:
             self.make_flag = '-sj{}'.format(self.threads)
 
 
-    def check_dependencies_in_path(self):
+    def check_dependencies_in_path(self, force_recheck=False):
         """Function meant to check if required packages are located in the system path.
 
+        Results are remembered for the current value of PATH, unless a recheck is forced.
+
+        Parameters
+        ----------
+        force_recheck : bool
+            if True, ignore any remembered result and search the path again
+
         Returns
         -------
         bool
@@ -77,27 +101,24 @@ class BuildDriver:
         """
 
         global WITHOUT_REQUESTS
+        path_env = os.environ.get('PATH', '')
+        if not force_recheck and path_env in self.dependency_check_cache:
+            return self.dependency_check_cache[path_env]
+
+        required = ['make', 'perl']
+        if WITHOUT_REQUESTS:
+            required.append('wget')
+        required.extend(['git', 'tar'])
+
         status = True
         message = ''
-        current = 'make'
-        FNULL = open(os.devnull, 'w')
-
-        try:
-            subprocess.call(['make', '--version'], stdout=FNULL, stderr=FNULL)
-            current = 'perl'
-            subprocess.call(['perl', '--version'], stdout=FNULL, stderr=FNULL)
-            if WITHOUT_REQUESTS:
-                current = 'wget'
-                subprocess.call(['wget', '--version'], stdout=FNULL, stderr=FNULL)
-            current = 'git'
-            subprocess.call(['git', '--version'], stdout=FNULL, stderr=FNULL)
-            current = 'tar'
-            subprocess.call(['tar', '--version'], stdout=FNULL, stderr=FNULL)
-        except FileNotFoundError:
-            status = False
-            message = current
-
-        FNULL.close()
+        for dependency in required:
+            if shutil.which(dependency, path=path_env) is None:
+                status = False
+                message = dependency
+                break
+
+        self.dependency_check_cache[path_env] = (status, message)
         return status, message
 
 
@@ -111,13 +132,22 @@ class BuildDriver:
         """
 
         LOG.debug('Grabbing dependencies via script {}'.format(dependency_script_path))
-        if os.path.exists(dependency_script_path) and os.path.isfile(dependency_script_path):
+        if os.path.isfile(dependency_script_path):
             if dependency_script_path.endswith('.bat'):
                 exec = dependency_script_path
+                LOG.print_command(exec)
+                proc = Popen(exec.split(' '))
             else:
-                exec = 'bash {}'.format(dependency_script_path)
-            LOG.print_command(exec)
-            proc = Popen(exec.split(' '))
+                # Package installs are merged, so the package manager is only invoked once per batch
+                with open(dependency_script_path, 'r') as script_fp:
+                    script_lines = script_fp.read().splitlines()
+                batched_lines = self.batch_package_installs(script_lines)
+                LOG.print_command('bash {}'.format(dependency_script_path))
+                for line in batched_lines:
+                    if line not in script_lines:
+                        LOG.print_command(line)
+                # The script path is passed as $0, so scripts can still locate files next to them
+                proc = Popen(['bash', '-c', '\n'.join(batched_lines), dependency_script_path])
             proc.wait()
             ret = proc.returncode
             if ret != 0:
@@ -125,6 +155,40 @@ class BuildDriver:
 
 
 
+    def batch_package_installs(self, script_lines):
+        """Function that merges consecutive package manager install lines of a dependency script
+
+        Lines such as 'sudo apt-get -y install gcc' followed by 'sudo apt-get -y install make'
+        become 'sudo apt-get -y install gcc make'. All other lines are kept in place.
+
+        Parameters
+        ----------
+        script_lines : list of str
+            lines of the dependency shell script
+
+        Returns
+        -------
+        list of str
+            lines of the script with install commands batched
+        """
+
+        batched = []
+        current_command = None
+        for line in script_lines:
+            match = PACKAGE_INSTALL_RE.match(line.strip())
+            if match is None:
+                if len(line.strip()) > 0 and not line.strip().startswith('#'):
+                    current_command = None
+                batched.append(line)
+            elif match.group(1) == current_command:
+                batched[install_index] = '{} {}'.format(batched[install_index], match.group(2))
+            else:
+                current_command = match.group(1)
+                install_index = len(batched)
+                batched.append(line.strip())
+        return batched
+
+
     def make_support_releases_consistent(self):
         """Function that makes support module release files consistent
 
@@ -145,6 +209,46 @@ class BuildDriver:
         return ret
 
 
+    def run_build_process(self, command, module_name, cwd=None):
+        """Function that runs a single build command for a module
+
+        If streaming is enabled, output is forwarded to stdout line by line, and only a bounded
+        tail of it is kept, which is stored in failure_logs if the command fails. Otherwise
+        the build process writes directly to the inherited stdout and stderr.
+
+        Parameters
+        ----------
+        command : str
+            command to execute
+        module_name : str
+            name of the module being built
+        cwd : str
+            directory in which to run the command, or None for the current directory
+
+        Returns
+        -------
+        int
+            exit code of the build command
+        """
+
+        LOG.print_command(command)
+        if not self.stream:
+            proc = Popen(command.split(' '), cwd=cwd)
+            return proc.wait()
+
+        tail = deque(maxlen=self.FAILURE_TAIL_LENGTH)
+        proc = Popen(command.split(' '), cwd=cwd, stdout=PIPE, stderr=STDOUT,
+                     universal_newlines=True, errors='replace', bufsize=1)
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+        proc.stdout.close()
+        ret = proc.wait()
+        if ret != 0:
+            self.failure_logs[module_name] = list(tail)
+        return ret
+
+
     def build_via_custom_script(self, module):
         """Function that builds a module using its custom build script
         
@@ -159,17 +263,51 @@ class BuildDriver:
             exit code of custom build script
         """
 
-        current = os.getcwd()
-        os.chdir(module.abs_path)
         if platform == 'win32':
             exec = module.custom_build_script_path
         else:
             exec = 'bash {}'.format(module.custom_build_script_path)
-        LOG.print_command(exec)
-        proc = Popen(exec.split(' '))
-        proc.wait()
-        ret = proc.returncode
-        os.chdir(current)
+        return self.run_build_process(exec, module.name, cwd=module.abs_path)
+
+
+    def build_single_module(self, module, make_flag=None):
+        """Function that builds a single module without first building its dependencies
+
+        Runs the module's custom build script from the module root directory if one
+        exists, otherwise runs make followed by specified make flag in module root directory.
+
+        Parameters
+        ----------
+        module : InstallModule
+            module to build
+        make_flag : str
+            make flag to use for this module, defaults to the make_flag attribute
+
+        Returns
+        -------
+        int
+            The return code of the build process
+        """
+
+        LOG.write('Building module {}'.format(module.name))
+        if module.custom_build_script_path is not None:
+            LOG.write('Detected custom build script located at {}'.format(module.custom_build_script_path))
+            ret = self.build_via_custom_script(module)
+            if ret == 0:
+                self.built.append(module.name)
+                LOG.write('Built module {} via custom script'.format(module.name))
+            else:
+                LOG.write('Custom script for module {} exited with error code {}.'.format(module.name, ret))
+        else:
+            if make_flag is None:
+                make_flag = self.make_flag
+            command = "make -C {} {}".format(module.abs_path, make_flag)
+            ret = self.run_build_process(command, module.name)
+            if ret == 0:
+                self.built.append(module.name)
+                LOG.write('Built module {}'.format(module.name))
+            else:
+                LOG.write('Failed to build module {}'.format(module.name))
         return ret
 
 
@@ -177,10 +315,7 @@ class BuildDriver:
         """Function that executes build of single module
 
         First, checks if all dependencies built, if not, does that first.
-        Then checks for custom build script. If one is found, runs that from
-        module root directory.
-        Otherwise, runs make followed by specified make flag in module root
-        directory.
+        Then builds the module itself with build_single_module.
 
         Parameters
         ----------
@@ -196,36 +331,134 @@ class BuildDriver:
         if module_name in self.non_build_packages:
             return 0
 
-        LOG.write('Building module {}'.format(module_name))
         module = self.install_config.get_module_by_name(module_name)
         if len(module.dependencies) > 0:
             for dep in module.dependencies:
                 if dep not in self.built:
                     self.build_module(dep)
-        if module.custom_build_script_path is not None:
-            LOG.write('Detected custom build script located at {}'.format(module.custom_build_script_path))
-            ret = self.build_via_custom_script(module)
-            if ret == 0:
-                self.built.append(module_name)
-                LOG.write('Built module {} via custom script'.format(module_name))
-            else:
-                LOG.write('Custom script for module {} exited with error code {}.'.format(module_name, ret))
-        else:
-            command = "make -C {} {}".format(module.abs_path, self.make_flag)
-            LOG.print_command(command)
-            proc = Popen(command.split(' '))
-            proc.wait()
-            ret = proc.returncode
-            if ret == 0:
-                self.built.append(module_name)
-                LOG.write('Built module {}'.format(module_name))
-            else:
-                LOG.write('Failed to build module {}'.format(module_name))
-        return ret
+        return self.build_single_module(module)
+
+
+    def get_modules_to_build(self):
+        """Function that gets the modules that are set to build
+
+        Returns
+        -------
+        List of InstallModule
+            modules set to build, in install config order
+        """
+
+        return [module for module in self.install_config.get_module_list()
+                if module.build == "YES" and module.name not in self.non_build_packages]
+
+
+    def has_dependency_info(self):
+        """Function that checks if module dependencies have been identified
+
+        Dependencies are only filled in by the dependency check of the update config driver.
+
+        Returns
+        -------
+        bool
+            True if any module set to build has known dependencies, otherwise False
+        """
+
+        return any(len(module.dependencies) > 0 for module in self.get_modules_to_build())
+
+
+    def get_build_graph(self):
+        """Function that creates the dependency graph of all modules that are set to build
+
+        Dependencies of modules set to build are built as well, even if they are not set to build
+        themselves, and every module depends on EPICS_BASE if it is built. If module dependencies
+        have not been identified, each module instead depends on the module before it, so modules
+        are built one at a time in install config order.
+
+        Returns
+        -------
+        dict of str -> set of str
+            Map of module name to names of modules that must be built before it, in install config order
+        """
+
+        to_build = self.get_modules_to_build()
+        if not self.has_dependency_info():
+            graph = {}
+            previous = None
+            for module in to_build:
+                graph[module.name] = set() if previous is None else set([previous])
+                previous = module.name
+            return graph
+
+        graph = {}
+        while len(to_build) > 0:
+            module = to_build.pop(0)
+            if module.name in graph:
+                continue
+            graph[module.name] = set()
+            for dep in module.dependencies:
+                dep_module = self.install_config.get_module_by_name(dep)
+                if dep in self.non_build_packages or dep_module is None:
+                    continue
+                graph[module.name].add(dep)
+                to_build.append(dep_module)
+
+        # Not every module lists EPICS_BASE in its RELEASE file, but all of them need it built first
+        if 'EPICS_BASE' in graph:
+            for name in graph.keys():
+                if name != 'EPICS_BASE':
+                    graph[name].add('EPICS_BASE')
+        return graph
+
+
+    def get_max_build_workers(self):
+        """Function that gets the number of modules that may be compiled at the same time
+
+        This is also the total number of make jobs shared by all modules being built.
+
+        Returns
+        -------
+        int
+            1 if single threaded, otherwise number of threads if set, or number of CPU cores
+        """
+
+        if self.one_thread:
+            return 1
+        elif self.threads != 0:
+            return self.threads
+        return os.cpu_count() or 1
+
+
+    def get_make_flag(self, jobs):
+        """Function that gets the make flag for building a module with a number of jobs
+
+        Parameters
+        ----------
+        jobs : int
+            number of make jobs the module may use
+
+        Returns
+        -------
+        str
+            -s for a single job, otherwise -sjNUM_JOBS
+        """
+
+        if jobs <= 1:
+            return '-s'
+        return '-sj{}'.format(jobs)
 
 
     def build_all(self):
-        """Main function that runs full build sequentially
+        """Main function that runs full build
+
+        Modules are built in dependency order. Any module whose dependencies have all been built
+        is dispatched to a pool of threads, so independent modules are compiled at the same time.
+        Modules depending on a module that failed to build, or on a circular dependency, are not
+        built, and are counted as failed. If module dependencies have not been identified, modules
+        are built one at a time in install config order, and a failed module does not stop the rest.
+
+        The make jobs given by get_max_build_workers are shared between modules. Each module that is
+        started receives an even share of the jobs not held by running modules, so at most that many
+        modules are built at once.
 
         Returns
         -------
@@ -235,18 +468,52 @@ class BuildDriver:
             List of module names that failed to compile
         """
 
+        remaining = self.get_build_graph()
+        ordered_only = not self.has_dependency_info()
+        max_jobs = self.get_max_build_workers()
+        running = {}
+        running_jobs = {}
         failed = []
-        for module in self.install_config.get_module_list():
-            if module.build == "YES":
-                out = self.build_module(module.name)
-                if out != 0:
-                    failed.append(module.name)
-
-                # After we build base we should make the support releases consistent
-                #if module.name == 'EPICS_BASE':
-                #    out = self.make_support_releases_consistent()
-                #    if out != 0:
-                #        LOG.write('Failed to make releases consistent...')
-                #        break
+        with ThreadPoolExecutor(max_workers=max_jobs) as executor:
+            while len(remaining) > 0 or len(running) > 0:
+                free_jobs = max_jobs - sum(running_jobs.values())
+                ready = [name for name, deps in remaining.items() if len(deps) == 0][:free_jobs]
+                for i, name in enumerate(ready):
+                    del remaining[name]
+                    module = self.install_config.get_module_by_name(name)
+                    jobs = free_jobs // (len(ready) - i)
+                    free_jobs = free_jobs - jobs
+                    future = executor.submit(self.build_single_module, module, self.get_make_flag(jobs))
+                    running[future] = name
+                    running_jobs[future] = jobs
+
+                if len(running) == 0:
+                    # Modules depending on failed modules were already removed, so the rest form a cycle
+                    for name in remaining.keys():
+                        LOG.write('Cannot build module {}, circular dependency on: {}'.format(name, ', '.join(sorted(remaining[name]))))
+                        failed.append(name)
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    del running_jobs[future]
+                    ret = future.result()
+                    if ret != 0:
+                        failed.append(name)
+                    if ret == 0 or ordered_only:
+                        # Without dependency information the order is not a requirement, so failures do not block
+                        for deps in remaining.values():
+                            deps.discard(name)
+                    else:
+                        # Drop everything that depends on the failed module, directly or indirectly
+                        blocked = [name]
+                        while len(blocked) > 0:
+                            dep = blocked.pop()
+                            for other in [other for other, deps in remaining.items() if dep in deps]:
+                                LOG.write('Cannot build module {}, dependency {} failed to build'.format(other, dep))
+                                del remaining[other]
+                                failed.append(other)
+                                blocked.append(other)
 
         return len(failed), failed
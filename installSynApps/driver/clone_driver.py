@@ -7,12 +7,11 @@ to the local machine.
 import os
 from subprocess import Popen, PIPE
 import shutil
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-try:
-    import requests
-    USE_WGET=False
-except ImportError:
-    USE_WGET=True
+# requests is only imported when an archive is downloaded, since it is slow to import
+USE_WGET = importlib.util.find_spec('requests') is None
 
 from sys import platform
 import installSynApps.data_model.install_config as IC
@@ -27,7 +26,7 @@ class CloneDriver:
 
     Attributes
     ----------
-    recursive_modules : List of str
+    recursive_modules : frozenset of str
         list of module names that need to be cloned recursively
     submodule_list : List of str
         list of module names that have submodules that must be initialized
@@ -42,7 +41,7 @@ class CloneDriver:
         """Constructor for the CloneDriver class
         """
 
-        self.recursive_modules = ["EPICS_BASE", "MOTOR"]
+        self.recursive_modules = frozenset(["EPICS_BASE", "MOTOR"])
         self.install_config = install_config
 
 
@@ -76,6 +75,7 @@ class CloneDriver:
                     try:
                         archive_path = installSynApps.join_path(os.path.dirname(module.abs_path), module.repository)
                         if not USE_WGET:
+                            import requests
                             r = requests.get(module.url + module.repository)
                             with open(archive_path, 'wb') as fp:
                                 fp.write(r.content)
@@ -157,30 +157,23 @@ class CloneDriver:
             if module.abs_path != None:
                 ret = 0
                 if module.version not in DEFAULT_BRANCH_NAMES and module.url_type == "GIT_URL":
-                    current_loc = os.getcwd()
-                    os.chdir(module.abs_path)
+                    # Commands are run with cwd set instead of os.chdir, so checkouts can run in parallel
                     command = "git checkout -q {}".format(module.version)
                     LOG.print_command(command)
-                    proc = Popen(command.split(' '))
+                    proc = Popen(command.split(' '), cwd=module.abs_path)
                     proc.wait()
                     ret = proc.returncode
 
                     if recursive and ret == 0:
                         command = 'git submodule update'
                         LOG.print_command(command)
-                        proc = Popen(command.split(' '))
+                        proc = Popen(command.split(' '), cwd=module.abs_path)
                         proc.wait()
                         ret = proc.returncode
 
                     # Retrieve commit hash of checked out module for exact versioning
-                    command = 'git rev-parse --short HEAD'
-                    LOG.print_command(command)
-                    proc = Popen(command.split(' '), stdout=PIPE)
-                    out, _ = proc.communicate()
-                    out = out.decode('utf-8')
-                    module.exact_hash = out
+                    module.exact_hash = self.get_head_hash(module)
 
-                    os.chdir(current_loc)
                     if ret == 0:
                         LOG.write('Checked out version {}'.format(module.version))
                     else:
@@ -188,16 +181,115 @@ class CloneDriver:
         return ret
 
 
-    def cleanup_modules(self):
-        """Function responsible for cleaning up directories that were not selected to clone
+    def get_head_hash(self, module):
+        """Function that finds the commit hash currently checked out for a module
+
+        After checking out a tag the HEAD is detached, and the hash can be read straight from
+        .git/HEAD without starting a git process. Otherwise falls back to git rev-parse. Both return
+        the full hash, since an abbreviated one varies in length and may become ambiguous.
+
+        Parameters
+        ----------
+        module : InstallModule
+            Module that was checked out
+
+        Returns
+        -------
+        str
+            Full commit hash of the module HEAD, or None if it could not be found
+        """
+
+        try:
+            with open(installSynApps.join_path(module.abs_path, '.git', 'HEAD'), 'r') as head_fp:
+                head = head_fp.read().strip()
+            if len(head) == 40 and not head.startswith('ref:'):
+                return head
+        except OSError:
+            pass
+
+        command = 'git rev-parse HEAD'
+        LOG.print_command(command)
+        proc = Popen(command.split(' '), stdout=PIPE, cwd=module.abs_path)
+        out, _ = proc.communicate()
+        out = out.decode('utf-8').strip()
+        if proc.returncode != 0 or len(out) == 0:
+            return None
+        return out
+
+
+    def get_unused_modules(self):
+        """Function that gets the modules that were not selected to clone
+
+        Returns
+        -------
+        List of InstallModule
+            modules with clone set to NO
         """
 
         if self.install_config != None and isinstance(self.install_config, IC.InstallConfiguration):
-            for module in self.install_config.modules:
-                if isinstance(module, IM.InstallModule):
-                    if module.clone == "NO" and os.path.exists(module.abs_path):
-                        LOG.debug('Removing unused repo {}'.format(module.name))
-                        shutil.rmtree(module.abs_path)
+            return [module for module in self.install_config.modules if isinstance(module, IM.InstallModule) and module.clone == "NO"]
+        return []
+
+
+    def cleanup_modules(self, unused_modules=None):
+        """Function responsible for cleaning up directories that were not selected to clone
+
+        Parameters
+        ----------
+        unused_modules : List of InstallModule
+            modules not selected to clone, as returned by get_unused_modules. Found from the install config if None
+        """
+
+        if unused_modules is None:
+            unused_modules = self.get_unused_modules()
+        for module in unused_modules:
+            if os.path.exists(module.abs_path):
+                LOG.debug('Removing unused repo {}'.format(module.name))
+                shutil.rmtree(module.abs_path)
+
+
+    def clone_and_checkout_module(self, module):
+        """Function that clones and then checks out a single module
+
+        Parameters
+        ----------
+        module : InstallModule
+            Module that is being cloned and checked out
+
+        Returns
+        -------
+        int
+            0 if success, <0 if either the clone or the checkout failed
+        """
+
+        recursive = module.name in self.recursive_modules
+        ret = self.clone_module(module, recursive=recursive)
+        if ret == 0:
+            ret = self.checkout_module(module, recursive=recursive)
+        return ret
+
+
+    def get_clone_graph(self):
+        """Function that finds, for each module to clone, the cloned modules that contain it
+
+        A module may only be cloned once every module whose directory contains it has been cloned.
+
+        Returns
+        -------
+        dict of str -> set of str
+            Map of module name to names of modules that must be cloned before it, in install config order
+        """
+
+        to_clone = [module for module in self.install_config.get_module_list() if module.clone == "YES"]
+        graph = {}
+        for module in to_clone:
+            containers = set()
+            if module.abs_path is not None:
+                for other in to_clone:
+                    if other is not module and other.abs_path is not None and module.abs_path.startswith(other.abs_path + '/'):
+                        containers.add(other.name)
+            graph[module.name] = containers
+        return graph
 
 
     def clone_and_checkout(self):
@@ -211,25 +303,67 @@ class CloneDriver:
 
         if isinstance(self.install_config, IC.InstallConfiguration):
             failed_modules = []
+            # Clone flags don't change during a clone, so split the modules once up front
+            unused_modules = self.get_unused_modules()
             for module in self.install_config.get_module_list():
                 if module.clone == "YES":
-                    ret = 0
-                    if module.name in self.recursive_modules:
-                        ret = self.clone_module(module, recursive=True)
-                    else:
-                        ret = self.clone_module(module)
+                    ret = self.clone_and_checkout_module(module)
                     if ret < 0:
                         failed_modules.append(module.name)
-                    else:
-                        if module.name in self.recursive_modules:
-                            ret = self.checkout_module(module, recursive=True)
-                        else:
-                            ret = self.checkout_module(module)
-                        if ret < 0:
-                            failed_modules.append(module.name)
-                    self.cleanup_modules()
+                    self.cleanup_modules(unused_modules)
 
             return failed_modules
 
         return None
 
+
+    def clone_and_checkout_parallel(self, max_workers=8):
+        """Top level function that clones and checks out all modules using a pool of threads.
+
+        Cloning is bound by network latency, so any module whose containing modules have all been cloned
+        is dispatched to a thread pool, rather than waiting for every module at the same nesting level.
+        Modules inside a module that failed to clone are not cloned, and are counted as failed.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of modules cloned at the same time
+
+        Returns
+        -------
+        List of str
+            List of all modules that failed to be correctly cloned and checked out
+        """
+
+        if isinstance(self.install_config, IC.InstallConfiguration):
+            failed_modules = []
+            remaining = self.get_clone_graph()
+            running = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while len(remaining) > 0 or len(running) > 0:
+                    ready = [name for name, containers in remaining.items() if len(containers) == 0]
+                    for name in ready:
+                        del remaining[name]
+                        module = self.install_config.get_module_by_name(name)
+                        running[executor.submit(self.clone_and_checkout_module, module)] = name
+
+                    if len(running) == 0:
+                        # Everything left is inside a module that failed to clone
+                        for name in remaining.keys():
+                            LOG.write('Cannot clone module {}, containing modules failed to clone: {}'.format(name, ', '.join(remaining[name])))
+                            failed_modules.append(name)
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        if future.result() == 0:
+                            for containers in remaining.values():
+                                containers.discard(name)
+                        else:
+                            failed_modules.append(name)
+
+            self.cleanup_modules()
+            return failed_modules
+
+        return None
@@ -45,7 +45,7 @@ class Packager:
         used for naming on linux. Allows for using different bundles for different linux distributions
     start_time : time
         a timestamp for the start of the tarring process
-    required_in_package : list of str
+    required_in_package : frozenset of str
         list of modules that will be packaged no matter what
     """
 
@@ -87,9 +87,9 @@ class Packager:
         self.start_time = 0
 
         # Modules that will be packaged if available regardless of configuration
-        self.required_in_package = ['EPICS_BASE', 'ASYN', 'BUSY', 'AREA_DETECTOR', 
-                                    'SUPPORT', 'ADCORE', 'ADSUPPORT', 'CALC', 'SNCSEQ', 
-                                    'SSCAN', 'DEVIOCSTATS', 'AUTOSAVE']
+        self.required_in_package = frozenset(['EPICS_BASE', 'ASYN', 'BUSY', 'AREA_DETECTOR', 
+                                              'SUPPORT', 'ADCORE', 'ADSUPPORT', 'CALC', 'SNCSEQ', 
+                                              'SSCAN', 'DEVIOCSTATS', 'AUTOSAVE'])
         
         self.ioc_gen = IOC_GENERATOR.DummyIOCGenerator(self.install_config)
 
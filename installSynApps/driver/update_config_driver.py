@@ -5,7 +5,6 @@ to run an installSynApps client with debug message printing enabled.
 """
 
 import os
-import re
 import shutil
 import installSynApps
 import installSynApps.data_model.install_config as IC
@@ -96,12 +95,14 @@ class UpdateConfigDriver:
         self.update_macros(support_config, False, False)
 
         # Some modules don't correctly have their RELEASE files updated by make release. Fix that here
+        # The module macros are the same for every RELEASE file, so only collect them once
+        install_macro_list = self.get_macros_from_install_config()
         for module in self.install_config.get_module_list():
             if module.clone == 'YES' and module.build == 'YES':
                 rel = installSynApps.join_path(module.abs_path, 'configure', 'RELEASE')
                 if os.path.exists(rel):
                     LOG.write('Updating RELEASE file for {}...'.format(module.name))
-                    self.update_macros(rel, True, True, single_file=True, auto_add_deps=True)
+                    self.update_macros(rel, True, True, single_file=True, auto_add_deps=True, install_macro_list=install_macro_list)
 
 
     def update_support_build_macros(self):
@@ -112,7 +113,7 @@ class UpdateConfigDriver:
             self.update_macros(installSynApps.join_path(module.abs_path, 'configure'), False, True, build_flags_only=True)
 
 
-    def update_macros(self, target_path, include_ad, force_uncomment, single_file=False, build_flags_only=False, auto_add_deps=False):
+    def update_macros(self, target_path, include_ad, force_uncomment, single_file=False, build_flags_only=False, auto_add_deps=False, install_macro_list=None):
         """Function that calls config injector to update all macros in target directory.
 
         This function is used on 3 occasions. 
@@ -134,11 +135,14 @@ class UpdateConfigDriver:
             In this case, only update the build flag macros specified in config, not module paths (use make release instead)
         auto_add_deps=False : bool
             When set to true, if a macro value is being added with another macro in it, the dependant macro is automatically added
+        install_macro_list=None : List of [str, str]
+            Precomputed result of get_macros_from_install_config, collected here if None
         """
 
-        install_macro_list = self.get_macros_from_install_config()
         if build_flags_only:
             install_macro_list = self.install_config.build_flags
+        elif install_macro_list is None:
+            install_macro_list = self.get_macros_from_install_config()
         
         if not single_file:
             self.config_injector.update_macros_dir(install_macro_list, target_path, force_override_comments=force_uncomment)
@@ -158,21 +162,20 @@ class UpdateConfigDriver:
 
         to_append_commented = []
         to_append = []
+
+        # Read the names of macros already defined in the RELEASE file once, rather than once per module
+        rel_file = open(installSynApps.join_path(self.install_config.support_path, "configure/RELEASE"), "r")
+        defined_macros = set(line.split('=', 1)[0] for line in rel_file if '=' in line)
+        rel_file.close()
+
         for module in self.install_config.get_module_list():
             if module.clone == "YES":
-                was_found = False
-                rel_file = open(installSynApps.join_path(self.install_config.support_path, "configure/RELEASE"), "r")
-                line = rel_file.readline()
-                while line:
-                    if line.startswith(module.name + "="):
-                        was_found = True
-                    line = rel_file.readline()
+                was_found = module.name in defined_macros
                 if not was_found and not module.name in self.add_to_release_blacklist and not module.name.startswith("AD"):
                     if module.build == "YES":
                         to_append.append([module.name, module.rel_path])
                     else:
                         to_append_commented.append([module.name, module.rel_path])
-                rel_file.close()
         app_file = open(self.install_config.support_path + "/configure/RELEASE", "a")
         for mod in to_append:
             LOG.debug('Adding {} path to support/configure/RELEASE'.format(mod[0]))
@@ -241,9 +244,7 @@ class UpdateConfigDriver:
             release_file.close()
             for line in lines:
                 if not line.startswith('#') and '=' in line:
-                    line = line.strip()
-                    line = re.sub(' +', '', line)
-                    dep = line.split('=')[0]
+                    dep = CI.SPACES_RE.sub('', line.strip()).split('=')[0]
                     if dep not in module.dependencies and dep not in self.dependency_ignore_list and dep != module.name:
                         module.dependencies.append(dep)
                         if dep == 'AREA_DETECTOR' or (module.rel_path.startswith('$(AREA_DETECTOR)') and module.name != 'ADSUPPORT' and module.name != 'ADCORE'):
@@ -12,6 +12,11 @@ import installSynApps
 import installSynApps.data_model.install_config as IC
 from installSynApps.io import logger as LOG
 
+
+# Compiled once, used to strip spaces from every macro line of every configure file
+SPACES_RE = re.compile(' +')
+
+
 class ConfigInjector:
     """Class that is responsible for injecting configuration information and replaces macros.
 
@@ -80,9 +85,12 @@ class ConfigInjector:
         """
 
         LOG.debug('Updating macros in directory {}'.format(target_dir))
-        if os.path.exists(target_dir) and os.path.isdir(target_dir):
-            for file in os.listdir(target_dir):
-                if os.path.isfile(target_dir + "/" + file) and not file.endswith(".pl") and file != "Makefile" and not file.endswith(".ioc"):
+        if os.path.isdir(target_dir):
+            # Files are renamed while updating, so take the listing up front. File types come from the listing itself.
+            with os.scandir(target_dir) as it:
+                target_files = [entry.name for entry in it if entry.is_file()]
+            for file in target_files:
+                if not file.endswith(".pl") and file != "Makefile" and not file.endswith(".ioc"):
                     self.update_macros_file(macro_replace_list, target_dir, file, force = force_override_comments)
 
 
@@ -118,6 +126,11 @@ class ConfigInjector:
         else:
             new_fp = open(installSynApps.join_path(target_dir, target_filename), "w")
 
+        # Map macro names to their macro-value pairs, so each line only checks the macros it can match
+        macro_map = {}
+        for macro in macro_replace_list:
+            macro_map.setdefault(macro[0], []).append(macro)
+
         written_macros = []
         line = old_fp.readline()
         while line:
@@ -126,42 +139,35 @@ class ConfigInjector:
 
             if target_filename == 'RELEASE' and 'areaDetector' not in target_dir and line.startswith('-include') and 'EPICS_BASE' not in written_macros and auto_add_deps:
                 LOG.debug('Detected RELEASE file missing EPICS_BASE...')
-                for m in macro_replace_list:
-                    if m[0] == 'EPICS_BASE':
-                        new_fp.write('EPICS_BASE={}\n\n'.format(m[1]))
-                        written_macros.append(m[0])
+                for m in macro_map.get('EPICS_BASE', []):
+                    new_fp.write('EPICS_BASE={}\n\n'.format(m[1]))
+                    written_macros.append(m[0])
 
             if '=' in line:
-                line = line = re.sub(' +', '', line)
+                line = SPACES_RE.sub('', line)
                 wrote_line = False
-                for macro in macro_replace_list:
-                    if line.startswith(macro[0] + "=") and (with_ad or (macro[0] not in self.ad_modules)):
+                line_name = line.split('=', 1)[0]
+                commented = line_name.startswith('#!') or line_name.startswith('#')
+                if line_name.startswith('#!'):
+                    line_name = line_name[2:]
+                elif line_name.startswith('#'):
+                    line_name = line_name[1:]
+                for macro in macro_map.get(line_name, []):
+                    if not commented and (with_ad or (macro[0] not in self.ad_modules)):
                         if line.split('=', 1)[1] != macro[1]:
                             LOG.debug('Replacing macro {}: original val {}, new val {} in file {}'.format(macro[0], line.split('=', 1)[1], macro[1], target_filename))
                         if '$(' in macro[1] and auto_add_deps:
-                            in_value_macro = macro[1].split('$(', 1)[1].split(')',1)[0]
-                            if in_value_macro not in written_macros:                            
-                                for m in macro_replace_list:
-                                    if m[0] == in_value_macro:
-                                        LOG.debug('Adding macro {} to satisfy macro used in {}={}'.format(in_value_macro, macro[0], macro[1]))
-                                        new_fp.write("{}={}\n".format(m[0], m[1]))
-                                        written_macros.append(m[0]) 
+                            self.write_value_macro_dependency(new_fp, macro, macro_map, written_macros)
                         new_fp.write("{}={}\n".format(macro[0], macro[1]))
                         written_macros.append(macro[0])
                         wrote_line = True
-                    elif line.startswith("#" + macro[0] + "=") or line.startswith("#!" + macro[0] + "="):
+                    elif commented:
                         if line.split('=', 1)[1] != macro[1]:
                             LOG.debug('Updating commented macro {}: original val {}, new val {} in file {}'.format(macro[0], line.split('=', 1)[1], macro[1], target_filename))
                         if force:
                             LOG.debug('Uncommenting commented macro {}'.format(macro[0]))
                             if '$(' in macro[1] and auto_add_deps:
-                                in_value_macro = macro[1].split('$(', 1)[1].split(')',1)[0]
-                                if in_value_macro not in written_macros:                            
-                                    for m in macro_replace_list:
-                                        if m[0] == in_value_macro:
-                                            LOG.debug('Adding macro {} to satisfy macro used in {}={}'.format(in_value_macro, macro[0], macro[1]))
-                                            new_fp.write("{}={}\n".format(m[0], m[1]))
-                                            written_macros.append(m[0])
+                                self.write_value_macro_dependency(new_fp, macro, macro_map, written_macros)
                             new_fp.write("{}={}\n".format(macro[0], macro[1]))
                             written_macros.append(macro[0])
                         else:
@@ -179,3 +185,24 @@ class ConfigInjector:
         old_fp.close()
 
 
+    def write_value_macro_dependency(self, new_fp, macro, macro_map, written_macros):
+        """Function that writes the macro used in the value of another macro, if it wasn't written yet
+
+        Parameters
+        ----------
+        new_fp : file
+            file being written
+        macro : [str, str]
+            macro-value pair whose value contains a macro
+        macro_map : dict of str -> List of [str, str]
+            macro-value pairs to replace, keyed by macro name
+        written_macros : List of str
+            names of macros already written to the file
+        """
+
+        in_value_macro = macro[1].split('$(', 1)[1].split(')',1)[0]
+        if in_value_macro not in written_macros:
+            for m in macro_map.get(in_value_macro, []):
+                LOG.debug('Adding macro {} to satisfy macro used in {}={}'.format(in_value_macro, macro[0], macro[1]))
+                new_fp.write("{}={}\n".format(m[0], m[1]))
+                written_macros.append(m[0])
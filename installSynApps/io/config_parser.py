@@ -7,6 +7,8 @@ DataModel objects representing the configuration.
 
 import os
 import re
+import stat
+import hashlib
 from sys import platform
 import installSynApps
 import installSynApps.data_model.install_config as IC
@@ -21,6 +23,10 @@ class ConfigParser:
     ----------
     configure_path : str
         path to installSynApps configure directory
+    injector_file_cache : dict of str -> ((int, int), str, str)
+        contents and target of previously parsed injector files, keyed by path
+    file_digest_cache : dict of str -> ((int, int), bytes)
+        content digests of previously hashed configure files, keyed by path
     """
 
 
@@ -30,8 +36,13 @@ class ConfigParser:
 
         self.configure_path = configure_path
 
+        # Parsed injector files, keyed by path, along with the modification time and size they were parsed at
+        self.injector_file_cache = {}
+        # Content digests of configure files, keyed by path, along with the modification time and size they were hashed at
+        self.file_digest_cache = {}
+
         # These modules must be included in an areaDetector binary bundle for the IOC to be able to run
-        self.required_in_package = ['EPICS_BASE', 'ASYN', 'BUSY', 'ADCORE', 'ADSUPPORT', 'CALC', 'SNCSEQ', 'SSCAN', 'DEVIOCSTATS', 'AUTOSAVE']
+        self.required_in_package = frozenset(['EPICS_BASE', 'ASYN', 'BUSY', 'ADCORE', 'ADSUPPORT', 'CALC', 'SNCSEQ', 'SSCAN', 'DEVIOCSTATS', 'AUTOSAVE'])
 
 
     def check_valid_config_path(self):
@@ -43,14 +54,117 @@ class ConfigParser:
             True if install path is valid, false otherwise
         """
 
-        if os.path.exists(self.configure_path) and os.path.isdir(self.configure_path):
+        # A single stat answers both the directory and the file question
+        try:
+            mode = os.stat(self.configure_path).st_mode
+        except OSError:
+            return False
+        if stat.S_ISDIR(mode):
             return True
-        elif os.path.exists(self.configure_path) and os.path.isfile(self.configure_path):
-            self.configure_path = self.configure_path.rsplit('/', 1)
+        elif stat.S_ISREG(mode):
+            self.configure_path = os.path.dirname(self.configure_path)
             return True
         return False
 
 
+    def get_configure_files(self):
+        """Function that lists all files in the configure directory, sorted by relative path
+
+        Returns
+        -------
+        list of (str, os.DirEntry)
+            relative path and directory entry of each file, None if configure path doesn't exist
+        """
+
+        if self.configure_path is None or not os.path.isdir(self.configure_path):
+            return None
+
+        files = []
+        self.add_directory_files(self.configure_path, '', files)
+        return files
+
+
+    def add_directory_files(self, dir_path, rel_path, files):
+        """Helper function that recursively appends each file in a directory
+
+        Entries are listed with os.scandir, so file types come from the directory listing, and
+        stat results are cached on the entries.
+
+        Parameters
+        ----------
+        dir_path : str
+            path to the directory
+        rel_path : str
+            path of the directory relative to the configure path
+        files : list of (str, os.DirEntry)
+            list to which relative paths and entries of files are appended
+        """
+
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            entry_rel_path = os.path.join(rel_path, entry.name)
+            if entry.is_dir():
+                self.add_directory_files(entry.path, entry_rel_path, files)
+            else:
+                files.append((entry_rel_path, entry))
+
+
+    def get_configure_signature(self):
+        """Function that gets the modification times and sizes of all files in the configure directory
+
+        Used to cheaply detect whether the configure directory changed since it was last parsed.
+
+        Returns
+        -------
+        tuple of (str, int, int)
+            relative path, modification time in ns, and size of each file, None if configure path doesn't exist
+        """
+
+        files = self.get_configure_files()
+        if files is None:
+            return None
+
+        signature = []
+        for rel_path, entry in files:
+            file_stat = entry.stat()
+            signature.append((rel_path, file_stat.st_mtime_ns, file_stat.st_size))
+        return tuple(signature)
+
+
+    def get_configure_digest(self):
+        """Function that hashes the names and contents of all files in the configure directory
+
+        Unlike the signature, the digest is unchanged if files are rewritten with the same contents.
+        Files whose modification time and size are unchanged since they were last hashed are not read again.
+
+        Returns
+        -------
+        str
+            hex digest of the configure directory, None if configure path doesn't exist
+        """
+
+        files = self.get_configure_files()
+        if files is None:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        for rel_path, entry in files:
+            file_stat = entry.stat()
+            file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+            cached = self.file_digest_cache.get(entry.path)
+            if cached is not None and cached[0] == file_key:
+                file_digest = cached[1]
+            else:
+                with open(entry.path, 'rb') as fp:
+                    file_digest = hashlib.blake2b(fp.read(), digest_size=16).digest()
+                self.file_digest_cache[entry.path] = (file_key, file_digest)
+            digest.update(rel_path.encode('utf-8'))
+            digest.update(b'\0')
+            digest.update(file_digest)
+        return digest.hexdigest()
+
+
     def parse_line_to_module(self, line, current_url, current_url_type):
         """Function that parses a line in the INSTALL_CONFIG file into an InstallModule object
 
@@ -119,69 +233,65 @@ class ConfigParser:
             None if there is no error, or a message describing the error
         """
 
-        # Check if exists
-        if os.path.exists(self.configure_path + "/" + config_filename):
-            # open the configure file
-            install_file = open(self.configure_path + "/" + config_filename, "r")
-
-            # variables
-            if install_file == None:
-                return None, "Couldn't open install file"
-            install_config = None
-            current_url = "dummy_url.com"
-            current_url_type = "GIT_URL"
-            install_loc = ""
-            message = None
-
-            line = install_file.readline()
-            while line:
-                line = line.strip()
-                if not line.startswith('#') and len(line) > 1:
-                    # Check for install location
-                    if line.startswith("INSTALL="):
-                        if force_location is None:
-                            install_loc = line.split('=')[-1]
-                            if install_loc.endswith('/'):
-                                install_loc = install_loc[:-1]
-                        else:
-                            install_loc = force_location
-                        if install_loc.startswith('/') and platform == 'win32':
-                            LOG.debug('Using linux path on windows, prepending C: to path.')
-                            install_loc = 'C:' + install_loc
-                        # create install config object
-                        install_config = IC.InstallConfiguration(install_loc, self.configure_path)
-                        
-                        # Error checking
-                        valid, err = install_config.is_install_valid()
-                        if not valid:
-                            if not allow_illegal:
-                                return None, err
-                            else:
-                                message = err
-                    # URL definition lines
-                    elif line.startswith("GIT_URL") or line.startswith("WGET_URL"):
-                        current_url = line.split('=')[1]
-                        if not current_url.endswith('/'):
-                            current_url = current_url + '/'
-                        current_url_type = line.split('=')[0]
-                    else:
-                        # Parse individual module line
-                        install_module = self.parse_line_to_module(line, current_url, current_url_type)
-                        if install_module is not None and install_config is not None:
-                            install_config.add_module(install_module)
-                line = install_file.readline()
-            
-            install_file.close()
-            # Read injectors and build flags
-            if install_config is None:
-                return None, 'Could not find INSTALL defined in given path'
-            self.read_injector_files(install_config)
-            self.read_build_flags(install_config)
-            self.parse_custom_build_scripts(install_config)
-            return install_config , message
-        else:
-            # Configure file not found
+        # Read the whole configure file in one go, failing if it doesn't exist
+        try:
+            with open(self.configure_path + "/" + config_filename, "r") as install_file:
+                lines = install_file.readlines()
+        except FileNotFoundError:
             return None, 'Configure Path not found'
+        except OSError:
+            return None, "Couldn't open install file"
+
+        # variables
+        install_config = None
+        current_url = "dummy_url.com"
+        current_url_type = "GIT_URL"
+        install_loc = ""
+        message = None
+
+        for line in lines:
+            line = line.strip()
+            if not line.startswith('#') and len(line) > 1:
+                # Check for install location
+                if line.startswith("INSTALL="):
+                    if force_location is None:
+                        install_loc = line.split('=')[-1]
+                        if install_loc.endswith('/'):
+                            install_loc = install_loc[:-1]
+                    else:
+                        install_loc = force_location
+                    if install_loc.startswith('/') and platform == 'win32':
+                        LOG.debug('Using linux path on windows, prepending C: to path.')
+                        install_loc = 'C:' + install_loc
+                    # create install config object
+                    install_config = IC.InstallConfiguration(install_loc, self.configure_path)
+                    
+                    # Error checking
+                    valid, err = install_config.is_install_valid()
+                    if not valid:
+                        if not allow_illegal:
+                            return None, err
+                        else:
+                            message = err
+                # URL definition lines
+                elif line.startswith("GIT_URL") or line.startswith("WGET_URL"):
+                    current_url = line.split('=')[1]
+                    if not current_url.endswith('/'):
+                        current_url = current_url + '/'
+                    current_url_type = line.split('=')[0]
+                else:
+                    # Parse individual module line
+                    install_module = self.parse_line_to_module(line, current_url, current_url_type)
+                    if install_module is not None and install_config is not None:
+                        install_config.add_module(install_module)
+
+        # Read injectors and build flags
+        if install_config is None:
+            return None, 'Could not find INSTALL defined in given path'
+        self.read_injector_files(install_config)
+        self.read_build_flags(install_config)
+        self.parse_custom_build_scripts(install_config)
+        return install_config , message
 
 
     def generate_default_injector_files(self, install_config):
@@ -201,6 +311,29 @@ class ConfigParser:
         install_config.add_injector_file('QUADEM_RELEASE',      '-include $(AREA_DETECTOR)/configure/RELEASE_PRODS.local', '$(SUPPORT)/quadEM/configure/RELEASE')
 
 
+    def list_config_files(self, dir_name):
+        """Function that lists the names of the files in a subdirectory of the configure directory
+
+        Uses a single os.scandir call, so file types are read from the directory listing.
+
+        Parameters
+        ----------
+        dir_name : str
+            name of the subdirectory, ex. injectionFiles
+
+        Returns
+        -------
+        list of str
+            names of the files in the subdirectory, empty if it does not exist
+        """
+
+        try:
+            with os.scandir(installSynApps.join_path(self.configure_path, dir_name)) as it:
+                return [entry.name for entry in it if entry.is_file()]
+        except FileNotFoundError:
+            return []
+
+
     def read_injector_files(self, install_config):
         """Function that reads the injector files and adds them to install config
         
@@ -212,15 +345,10 @@ class ConfigParser:
 
         if install_config is None:
             return
-        elif not os.path.exists(self.configure_path + '/injectionFiles'):
-            self.generate_default_injector_files(install_config)
-            return
-        num_found = 0
-        for file in os.listdir(self.configure_path + '/injectionFiles'):
-            if os.path.isfile(self.configure_path + '/injectionFiles/' + file):
-                self.parse_injector_file(file, install_config)
-                num_found = num_found + 1
-        if num_found == 0:
+        injector_file_names = self.list_config_files('injectionFiles')
+        for file in injector_file_names:
+            self.parse_injector_file(file, install_config)
+        if len(injector_file_names) == 0:
             self.generate_default_injector_files(install_config)
 
 
@@ -235,22 +363,30 @@ class ConfigParser:
             config to add the file to
         """
 
-        fp = open(self.configure_path + '/injectionFiles/' + injector_file_name, 'r')
-        contents = ''
-        link=''
+        injector_path = self.configure_path + '/injectionFiles/' + injector_file_name
+        file_stat = os.stat(injector_path)
+        file_key = (file_stat.st_mtime_ns, file_stat.st_size)
 
-        line = fp.readline()
-        while line:
-            if not line.startswith('#') and len(line) > 1:
-                if line.startswith('__TARGET_LOC__='):
-                    line = line.strip()
-                    link = line.split('=')[1]
-                else:
-                    contents = contents + line
+        # Reuse the contents and link read last time if the file is unchanged
+        cached = self.injector_file_cache.get(injector_path)
+        if cached is not None and cached[0] == file_key:
+            _, contents, link = cached
+        else:
+            with open(injector_path, 'r') as fp:
+                lines = fp.readlines()
 
-            line = fp.readline()
+            contents = []
+            link=''
+            for line in lines:
+                if not line.startswith('#') and len(line) > 1:
+                    if line.startswith('__TARGET_LOC__='):
+                        line = line.strip()
+                        link = line.split('=')[1]
+                    else:
+                        contents.append(line)
+            contents = ''.join(contents)
+            self.injector_file_cache[injector_path] = (file_key, contents, link)
 
-        fp.close()
         install_config.add_injector_file(injector_file_name, contents, link)
 
 
@@ -265,11 +401,8 @@ class ConfigParser:
 
         if install_config is None:
             return
-        elif not os.path.exists(self.configure_path + '/macroFiles'):
-            return
-        for file in os.listdir(self.configure_path + '/macroFiles'):
-            if os.path.isfile(self.configure_path + '/macroFiles/' + file):
-                self.parse_macro_file(file, install_config)
+        for file in self.list_config_files('macroFiles'):
+            self.parse_macro_file(file, install_config)
 
 
     def parse_macro_file(self, macro_file_name, install_config):
@@ -314,7 +447,9 @@ class ConfigParser:
         # make sure the build script path is absolute
         build_script_folder = os.path.abspath(installSynApps.join_path(self.configure_path, 'customBuildScripts'))
         if os.path.exists(build_script_folder):
+            # List the folder once, rather than once per module
+            build_scripts = os.listdir(build_script_folder)
             for module in install_config.get_module_list():
-                for file in os.listdir(build_script_folder):
+                for file in build_scripts:
                     if file.startswith(module.name):
                         module.custom_build_script_path = installSynApps.join_path(build_script_folder, file)
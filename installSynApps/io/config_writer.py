@@ -9,9 +9,19 @@ import os
 import errno
 import shutil
 import installSynApps
-from installSynApps.data_model import *
 from installSynApps.io import logger as LOG
 
+
+# Fixed top of every INSTALL_CONFIG file, formatted with the save time and install location
+INSTALL_CONFIG_HEADER = ('#\n# INSTALL_CONFIG file saved by installSynApps on {}\n#\n\n'
+                         'INSTALL={}\n\n\n'
+                         '#MODULE_NAME    MODULE_VERSION          MODULE_PATH                             MODULE_REPO         CLONE_MODULE    BUILD_MODULE    PACKAGE_MODULE\n'
+                         '#--------------------------------------------------------------------------------------------------------------------------------------------------\n')
+
+# Column layout of each module line in INSTALL_CONFIG. %-style, since it is applied once per module
+MODULE_LINE_FORMAT = "%-16s %-20s %-40s %-24s %-16s %-16s %s\n"
+
+
 class ConfigWriter:
     """Class that is responsible for writing Install Configurations
 
@@ -28,40 +38,41 @@ class ConfigWriter:
         self.install_config = install_config
 
 
-    def write_injector_files(self, filepath):
+    def write_injector_files(self, filepath, dir_name='injectionFiles'):
         """Helper Function for writing injector files from install config
 
         Parameters
         ----------
         filepath : str
             Path into which we wish to save configuration
+        dir_name : str
+            Name of the directory in filepath into which injector files are written
         """
 
         # for each injector file write it with its target location
         for injector_file in self.install_config.injector_files:
             LOG.debug('Saving injector file {} with target {}'.format(injector_file.name, injector_file.target))
-            new_fp = open(filepath + "/injectionFiles/" + injector_file.name, 'w')
-            new_fp.write('# Saved by installSynApps on {}\n'.format(datetime.datetime.now()))
-            new_fp.write('__TARGET_LOC__={}\n\n'.format(injector_file.target))
-            new_fp.write(injector_file.contents)
-            new_fp.close()
+            with open(filepath + "/" + dir_name + "/" + injector_file.name, 'w') as new_fp:
+                new_fp.write('# Saved by installSynApps on {}\n__TARGET_LOC__={}\n\n{}'.format(datetime.datetime.now(), injector_file.target, injector_file.contents))
 
 
-    def write_build_flags(self, filepath):
+    def write_build_flags(self, filepath, dir_name='macroFiles'):
         """Helper Function for writing build flags from install config
 
         Parameters
         ----------
         filepath : str
             Path into which we wish to save configuration
+        dir_name : str
+            Name of the directory in filepath into which the build flag file is written
         """
 
-        new_build_flag = open(filepath + "/macroFiles/BUILD_FLAG_CONFIG", 'w')
-        new_build_flag.write('# Saved by installSynApps on {}\n\n'.format(datetime.datetime.now()))
+        lines = ['# Saved by installSynApps on {}\n\n'.format(datetime.datetime.now())]
         for macro_pair in self.install_config.build_flags:
             LOG.debug('Writing build flag {}={}'.format(macro_pair[0], macro_pair[1]))
-            new_build_flag.write('{}={}\n'.format(macro_pair[0], macro_pair[1]))
-        new_build_flag.close()
+            lines.append('{}={}\n'.format(macro_pair[0], macro_pair[1]))
+        with open(filepath + "/" + dir_name + "/BUILD_FLAG_CONFIG", 'w') as new_build_flag:
+            new_build_flag.write(''.join(lines))
 
 
     def write_custom_build_scripts(self, filepath):
@@ -97,6 +108,8 @@ class ConfigWriter:
         ----------
         filepath : str
             defaults to addtlConfDirs/config$DATE. The filepath into which to save the install configuration
+        overwrite_existing : bool
+            if True, injector and macro files already in filepath are replaced once the new ones are written
 
         Returns
         -------
@@ -106,65 +119,87 @@ class ConfigWriter:
             None if successfull, otherwise error message
         """
 
-        if overwrite_existing and os.path.exists(filepath):
+        # Create the path if it doesn't exist, an existing directory is fine
+        try:
+            os.mkdir(filepath)
+        except FileExistsError:
+            pass
+        except OSError as err:
+            if err.errno == errno.EACCES:
+                return False, 'Permission Error!'
+            elif err.errno == errno.ENOSPC:
+                return False, 'No space on device!'
+            elif err.errno == errno.EROFS:
+                return False, 'Read-Only File System!'
+            else:
+                return False, 'Unknown Error'
+
+        # When overwriting, injector and macro files are written to staging directories, and only swapped in
+        # once complete, so a failed save never leaves the existing config without them
+        injector_dir_name, macro_dir_name = 'injectionFiles', 'macroFiles'
+        if overwrite_existing:
+            injector_dir_name, macro_dir_name = 'injectionFiles.tmp', 'macroFiles.tmp'
             try:
-                shutil.rmtree(installSynApps.join_path(filepath, 'injectionFiles'))
-                shutil.rmtree(installSynApps.join_path(filepath, 'macroFiles'))
-                os.remove(installSynApps.join_path(filepath, 'INSTALL_CONFIG'))
+                installSynApps.remove_tree(installSynApps.join_path(filepath, injector_dir_name))
+                installSynApps.remove_tree(installSynApps.join_path(filepath, macro_dir_name))
             except PermissionError:
                 return False, 'Insufficient Permissions'
-
-        # Check if path exists, create it if it doesn't
-        if not os.path.exists(filepath):
-            try:
-                os.mkdir(filepath)
-            except OSError as err:
-                if err.errno == errno.EACCES:
-                    return False, 'Permission Error!'
-                elif err.errno == errno.EEXIST:
-                    return False, 'Path already exists!'
-                elif err.errno == errno.ENOSPC:
-                    return False, 'No space on device!'
-                elif err.errno == errno.EROFS:
-                    return False, 'Read-Only File System!'
-                else:
-                    return False, 'Unknown Error'
         try:
-            os.mkdir(installSynApps.join_path(filepath, 'injectionFiles'))
-            os.mkdir(installSynApps.join_path(filepath, 'macroFiles'))
-            if not os.path.exists(installSynApps.join_path(filepath, 'customBuildScripts')):
-                os.mkdir(installSynApps.join_path(filepath, 'customBuildScripts'))
+            os.mkdir(installSynApps.join_path(filepath, injector_dir_name))
+            os.mkdir(installSynApps.join_path(filepath, macro_dir_name))
+            os.makedirs(installSynApps.join_path(filepath, 'customBuildScripts'), exist_ok=True)
 
         except OSError:
             LOG.write('Failed to make configuration directories!')
             return False, 'Unknown Error'
 
         LOG.debug('Writing injector files.')
-        self.write_injector_files(filepath)
+        self.write_injector_files(filepath, dir_name=injector_dir_name)
 
         LOG.debug('Writing build flags.')
-        self.write_build_flags(filepath)
+        self.write_build_flags(filepath, dir_name=macro_dir_name)
+
+        if overwrite_existing:
+            LOG.debug('Replacing previous injector and macro files.')
+            try:
+                for staged_dir_name, dir_name in [(injector_dir_name, 'injectionFiles'), (macro_dir_name, 'macroFiles')]:
+                    dir_path = installSynApps.join_path(filepath, dir_name)
+                    installSynApps.remove_tree(dir_path)
+                    os.replace(installSynApps.join_path(filepath, staged_dir_name), dir_path)
+            except PermissionError:
+                return False, 'Insufficient Permissions'
 
         LOG.debug('Writing custom build scripts.')
         self.write_custom_build_scripts(filepath)
 
         LOG.debug('Writing INSTALL_CONFIG file.')
-        new_install_config = open(installSynApps.join_path(filepath, "INSTALL_CONFIG"), "w+")
-        new_install_config.write('#\n# INSTALL_CONFIG file saved by installSynApps on {}\n#\n\n'.format(datetime.datetime.now())) 
-        new_install_config.write("INSTALL={}\n\n\n".format(self.install_config.install_location))
+        # Write to a temporary file and swap it in, so an interrupted save never leaves a partial INSTALL_CONFIG
+        install_config_path = installSynApps.join_path(filepath, 'INSTALL_CONFIG')
+        with open(install_config_path + '.tmp', 'w') as new_install_config:
+            new_install_config.write(self.get_install_config_text())
+        os.replace(install_config_path + '.tmp', install_config_path)
+        return True, None
+
+
+    def get_install_config_text(self):
+        """Function that formats the contents of the INSTALL_CONFIG file for the install config
+
+        Returns
+        -------
+        str
+            full text of the INSTALL_CONFIG file
+        """
 
-        new_install_config.write('#MODULE_NAME    MODULE_VERSION          MODULE_PATH                             MODULE_REPO         CLONE_MODULE    BUILD_MODULE    PACKAGE_MODULE\n')
-        new_install_config.write('#--------------------------------------------------------------------------------------------------------------------------------------------------\n')
+        lines = [INSTALL_CONFIG_HEADER.format(datetime.datetime.now(), self.install_config.install_location)]
 
         current_url = ""
         for module in self.install_config.get_module_list():
             if module.url != current_url:
-                new_install_config.write("\n{}={}\n\n".format(module.url_type, module.url))
+                lines.append("\n{}={}\n\n".format(module.url_type, module.url))
                 current_url = module.url
             ver_to_write = module.version
             if module.exact_hash is not None:
                 ver_to_write = module.exact_hash
-            new_install_config.write("{:<16} {:<20} {:<40} {:<24} {:<16} {:<16} {}\n".format(module.name, ver_to_write, module.rel_path, module.rel_repo, module.clone, module.build, module.package))
+            lines.append(MODULE_LINE_FORMAT % (module.name, ver_to_write, module.rel_path, module.rel_repo, module.clone, module.build, module.package))
 
-        new_install_config.close()
-        return True, None
\ No newline at end of file
+        return ''.join(lines)
@@ -132,14 +132,14 @@ https://github.com/NSLS-II/installSynApps\n\n".format(datetime.datetime.now())
         
         install_fp.write(self.message)
 
-        for module in self.install_config.get_module_list():
-            if module.build == "YES":
-                install_fp.write("{}={}\n".format(module.name, module.abs_path))
+        # Filter the built modules once, both sections of the script use them
+        modules = [module for module in self.install_config.get_module_list() if module.build == "YES"]
 
-        for module in self.install_config.get_module_list():
-            if module.build == "YES":
-                install_fp.write("cd ${}\n".format(module.name))
-                install_fp.write("make -sj\n")
+        for module in modules:
+            install_fp.write("{}={}\n".format(module.name, module.abs_path))
+
+        for module in modules:
+            install_fp.write("cd ${}\nmake -sj\n".format(module.name))
 
         install_fp.close()
 
@@ -154,20 +154,15 @@ https://github.com/NSLS-II/installSynApps\n\n".format(datetime.datetime.now())
 
         uninstall_fp.write(self.message)
 
-        modules = self.install_config.get_module_list()
-        modules.reverse()
+        # Filter the built modules once in reverse order, rather than reversing the shared module list in place
+        modules = [module for module in reversed(self.install_config.get_module_list()) if module.build == "YES"]
 
         for module in modules:
-            if module.build == "YES":
-                uninstall_fp.write("{}={}\n".format(module.name, module.abs_path))
+            uninstall_fp.write("{}={}\n".format(module.name, module.abs_path))
 
         for module in modules:
-            if module.build == "YES":
-                uninstall_fp.write("cd ${}\n".format(module.name))
-                uninstall_fp.write("make clean uninstall\n")
-                uninstall_fp.write("make clean uninstall\n")
+            uninstall_fp.write("cd ${}\nmake clean uninstall\nmake clean uninstall\n".format(module.name))
     
-        modules.reverse()
         uninstall_fp.close()
 
 
@@ -204,16 +199,18 @@ https://github.com/NSLS-II/installSynApps\n\n".format(datetime.datetime.now())
         readme_fp.write("https://github.com/NSLS-II/installSynApps\n")
         readme_fp.write("-------------------------------------------------------\n")
         readme_fp.write("The following modules were installed with the following version numbers:\n\n")
+        # Sort modules into built and cloned only in a single pass over the module list
+        built_lines, cloned_lines = [], []
         for module in self.install_config.get_module_list():
             if module.build == "YES":
-                readme_fp.write("{} -> {}\n".format(module.name, module.version))
+                built_lines.append("{} -> {}\n".format(module.name, module.version))
+            elif module.build == "NO" and module.clone == "YES":
+                cloned_lines.append("{} -> {}\n".format(module.name, module.version))
+        readme_fp.writelines(built_lines)
         
         readme_fp.write("-------------------------------------------------------\n")
         readme_fp.write("The following modules were cloned with the given versions but not auto-built\n\n")
-        
-        for module in self.install_config.get_module_list():
-            if module.build == "NO" and module.clone == "YES":
-                readme_fp.write("{} -> {}\n".format(module.name, module.version))
+        readme_fp.writelines(cloned_lines)
         
         readme_fp.close()
 
@@ -48,8 +48,7 @@ def initialize_logger():
 
     global _LOG_FILE
     try:
-        if not os.path.exists('logs'):
-            os.mkdir('logs')
+        os.makedirs('logs', exist_ok=True)
         _LOG_FILE = open(installSynApps.join_path('logs', _LOG_FILE_PATH), 'w')
     except OSError:
         write('Failed to initialize log file...')
@@ -150,7 +149,7 @@ def write(text, no_timestamp=True):
 
     # remove timestamp if not in use
     if not _DEBUG or no_timestamp:
-        final_text = '{}\n'.format(text)
+        final_text = str(text) + '\n'
     else:
         # otherwise add timestamp
         final_text = '{} - {}\n'.format(datetime.datetime.now(), text)
@@ -110,20 +110,18 @@ class AddCustomBuildScriptGUI:
         if not found and not ifsame:
             return
 
-        self.editPanel.delete('1.0', END)
-        self.editPanel.insert(INSERT, '#\n')
-        self.editPanel.insert(INSERT, '# Custom Build script for module {}\n'.format(self.currentModule.name))
+        # Build the full panel text first, and write it with a single insert
+        panel_text = ['#\n', '# Custom Build script for module {}\n'.format(self.currentModule.name)]
         if self.currentModule.custom_build_script_path is None:
-            self.editPanel.insert(INSERT, '# Currently, module {} will not apply a custom build script.\n'.format(self.currentModule.name))
+            panel_text.append('# Currently, module {} will not apply a custom build script.\n'.format(self.currentModule.name))
         else:
-            self.editPanel.insert(INSERT, '# Building {} will use script from {}/{}\n'.format(self.currentModule.name, '$CONFIGURE/customBuildScripts', os.path.basename(self.currentModule.custom_build_script_path)))
-        self.editPanel.insert(INSERT, '#\n')
+            panel_text.append('# Building {} will use script from {}/{}\n'.format(self.currentModule.name, '$CONFIGURE/customBuildScripts', os.path.basename(self.currentModule.custom_build_script_path)))
+        panel_text.append('#\n')
         if self.currentModule.custom_build_script_path is not None:
-            custom_build = open(self.currentModule.custom_build_script_path, 'r')
-            script = custom_build.readlines()
-            for line in script:
-                self.editPanel.insert(INSERT, line)
-            custom_build.close()
+            with open(self.currentModule.custom_build_script_path, 'r') as custom_build:
+                panel_text.append(custom_build.read())
+        self.editPanel.delete('1.0', END)
+        self.editPanel.insert(INSERT, ''.join(panel_text))
 
 
     def applyChanges(self):
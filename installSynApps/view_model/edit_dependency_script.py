@@ -72,12 +72,14 @@ class EditDependencyScriptGUI:
         """Function that deletes the dependency Script
         """
 
-        if self.root.configure_path is None:
+        if self.root.dependency_script_path is None:
             self.root.showErrorMessage('ERROR', 'ERROR - No configure directory loaded, please save the configuration first.', force_popup=True)
-        elif not os.path.exists(os.path.join(self.root.configure_path, 'dependencyInstall' + self.extension)):
-            self.root.showErrorMessage('ERROR', 'ERROR - No dependency script has been saved yet for this configuration.', force_popup=True)
         else:
-            os.remove(os.path.join(self.root.configure_path, 'dependencyInstall' + self.extension))
+            try:
+                os.remove(self.root.dependency_script_path)
+            except FileNotFoundError:
+                self.root.showErrorMessage('ERROR', 'ERROR - No dependency script has been saved yet for this configuration.', force_popup=True)
+                return
             self.root.updateAllRefs(self.install_config)
             self.reloadPanel()
             
@@ -95,17 +97,18 @@ class EditDependencyScriptGUI:
         """
 
         self.editPanel.delete('1.0', END)
-        self.editPanel.insert(INSERT, '#\n')
-        self.editPanel.insert(INSERT, '# Dependency script for building EPICS/synApps\n')
-        self.editPanel.insert(INSERT, '# Script will be saved as {}\n'.format('$(CONFIGURE_PATH)/dependencyInstall' + self.extension))
-        self.editPanel.insert(INSERT, '# To run the script before build, make sure to toggle install dependencies on.\n')
-        self.editPanel.insert(INSERT, '#\n')
-        if os.path.exists(os.path.join(self.root.configure_path, 'dependencyInstall' + self.extension)):
-            dep_script = open(os.path.join(self.root.configure_path, 'dependencyInstall' + self.extension), 'r')
-            script = dep_script.readlines()
-            for line in script:
-                self.editPanel.insert(INSERT, line)
-            dep_script.close()
+        panel_text = ['#\n',
+                      '# Dependency script for building EPICS/synApps\n',
+                      '# Script will be saved as {}\n'.format('$(CONFIGURE_PATH)/dependencyInstall' + self.extension),
+                      '# To run the script before build, make sure to toggle install dependencies on.\n',
+                      '#\n']
+        if self.root.dependency_script_path is not None:
+            try:
+                with open(self.root.dependency_script_path, 'r') as dep_script:
+                    panel_text.append(dep_script.read())
+            except FileNotFoundError:
+                pass
+        self.editPanel.insert(INSERT, ''.join(panel_text))
 
 
     def applyChanges(self):
@@ -117,11 +120,11 @@ class EditDependencyScriptGUI:
         temp = self.editPanel.get('1.0', END).splitlines()
 
 
-        if not self.root.install_loaded:
+        if self.root.dependency_script_path is None:
             self.root.showWarningMessage('Error', 'Currently loaded Install configuration has not been saved. Please save it first to be able to save dependency scripts.')
             return
 
-        build_script_file = os.path.join(self.root.configure_path, 'dependencyInstall' + self.extension)
+        build_script_file = self.root.dependency_script_path
         if os.path.exists(build_script_file):
             os.remove(build_script_file)
 
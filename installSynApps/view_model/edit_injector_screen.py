@@ -116,11 +116,7 @@ class EditInjectorGUI:
                 contents = file.contents
                 link = file.target
         self.editPanel.delete('1.0', END)
-        self.editPanel.insert(INSERT, '#\n')
-        self.editPanel.insert(INSERT, '# The below contents will be injected into:\n')
-        self.editPanel.insert(INSERT, '# {}\n'.format(link))
-        self.editPanel.insert(INSERT, '#\n\n')
-        self.editPanel.insert(INSERT, contents)
+        self.editPanel.insert(INSERT, '#\n# The below contents will be injected into:\n# {}\n#\n\n{}'.format(link, contents))
 
 
     def applyChanges(self):
@@ -130,10 +126,7 @@ class EditInjectorGUI:
         """
 
         temp = self.editPanel.get('1.0', END).splitlines()
-        new_contents = ''
-        for line in temp:
-            if not line.startswith('#'):
-                new_contents = new_contents + line + '\n'
+        new_contents = ''.join(line + '\n' for line in temp if not line.startswith('#'))
         target = self.currentEditVar.get()
         for file in self.install_config.injector_files:
             if file.name == target:
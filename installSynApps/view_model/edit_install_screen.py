@@ -164,19 +164,10 @@ class EditConfigGUI:
                     module.package = 'NO'
                 module.version = self.installModuleLines[module.name]['versionTextBox'].get('1.0', END).strip()
 
-            module.abs_path = self.install_config.convert_path_abs(module.rel_path)
+        self.install_config.relocate(self.install_config.install_location)
 
-            if module.name == 'EPICS_BASE':
-                self.install_config.base_path = module.abs_path
-            elif module.name == 'SUPPORT':
-                self.install_config.support_path = module.abs_path
-            elif module.name == 'AREA_DETECTOR':
-                self.install_config.ad_path = module.abs_path
-            elif module.name == 'MOTOR':
-                self.install_config.motor_path = module.abs_path
-
-        self.root.updateConfigPanel()
         self.root.updateAllRefs(self.install_config)
+        self.root.updateConfigPanel()
         if self.install_config.is_install_valid():
             self.root.valid_install = True
         else:
@@ -64,9 +64,9 @@ class EditMacroGUI:
         """
 
         self.editPanel.delete('1.0', END)
-        self.editPanel.insert(INSERT, '# Below are currently loaded macros.\n# Please keep new macros in the format MACRO=VALUE.\n\n')
-        for pair in self.install_config.build_flags:
-            self.editPanel.insert(INSERT, '{}={}\n'.format(pair[0], pair[1]))
+        panel_text = ['# Below are currently loaded macros.\n# Please keep new macros in the format MACRO=VALUE.\n\n']
+        panel_text.extend('{}={}\n'.format(pair[0], pair[1]) for pair in self.install_config.build_flags)
+        self.editPanel.insert(INSERT, ''.join(panel_text))
         
         self.editPanel.see(END)
 
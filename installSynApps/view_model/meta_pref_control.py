@@ -13,6 +13,8 @@ class MetaDataController:
         location for metadata/settings
     metadata : dict
         dictionary that stores all settings/metadata
+    saved_metadata : str
+        serialized metadata as it was last read or saved, used to skip unchanged saves
     """
 
 
@@ -23,7 +25,7 @@ class MetaDataController:
         home = os.path.expanduser('~')
 
         self.pref_loc = os.path.join(home, '.epics-install')
-        if not self.pref_loc:
+        if not os.path.exists(self.pref_loc):
             try:
                 os.mkdir(self.pref_loc)
             except OSError:
@@ -36,6 +38,7 @@ class MetaDataController:
                 self.metadata = json.load(json_file)
         else:
             self.metadata = {}
+        self.saved_metadata = json.dumps(self.metadata, sort_keys=True)
 
 
     def save_metadata(self):
@@ -44,6 +47,10 @@ class MetaDataController:
 
         if self.pref_loc is None:
             return False, 'ERROR - Could not load preferences dir'
+
+        serialized = json.dumps(self.metadata, sort_keys=True)
+        if serialized == self.saved_metadata:
+            return True, 'Preference metadata unchanged'
         
         settings_file_path = os.path.join(self.pref_loc, 'epics_install_metadata.json')
         
@@ -51,6 +58,7 @@ class MetaDataController:
             os.remove(settings_file_path)
 
         with open(settings_file_path, 'w') as set_file:
-            json.dump(self.metadata, set_file) 
+            set_file.write(serialized)
+        self.saved_metadata = serialized
 
         return True, 'Saved preference metadata'
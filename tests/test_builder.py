@@ -32,3 +32,106 @@ def test_create_make_flag_3():
     builder.one_thread = True
     builder.create_make_flags()
     assert builder.make_flag == '-s'
+
+
+def test_get_build_graph():
+    graph = builder.get_build_graph()
+    assert 'SUPPORT' not in graph and 'AREA_DETECTOR' not in graph
+    names = list(graph.keys())
+    for i, name in enumerate(names):
+        assert parsed_config.get_module_by_name(name).build == 'YES'
+        assert graph[name] == (set() if i == 0 else set([names[i - 1]]))
+
+
+def get_scheduling_builder():
+    config, _ = Parser.ConfigParser('tests/TestConfigs/basic').parse_install_config()
+    scheduling_builder = Builder.BuildDriver(config, 4)
+    order = []
+
+    def build_single_module(module, make_flag=None):
+        order.append(module.name)
+        return 0
+
+    scheduling_builder.build_single_module = build_single_module
+    return config, scheduling_builder, order
+
+
+def test_get_build_graph_dependencies():
+    config, scheduling_builder, _ = get_scheduling_builder()
+    config.get_module_by_name('DUMMY').dependencies = ['ADCORE', 'MODBUS']
+    config.get_module_by_name('MODBUS').build = 'NO'
+    graph = scheduling_builder.get_build_graph()
+    assert graph['DUMMY'] == set(['EPICS_BASE', 'ADCORE', 'MODBUS'])
+    assert graph['MODBUS'] == set(['EPICS_BASE'])
+    assert graph['ADCORE'] == set(['EPICS_BASE'])
+    assert graph['EPICS_BASE'] == set()
+
+
+def test_build_all_dependency_order():
+    config, scheduling_builder, order = get_scheduling_builder()
+    config.get_module_by_name('ADCORE').dependencies = ['EPICS_BASE']
+    config.get_module_by_name('DUMMY').dependencies = ['EPICS_BASE', 'ADCORE', 'MODBUS']
+    config.get_module_by_name('MODBUS').build = 'NO'
+    ret, failed = scheduling_builder.build_all()
+    assert (ret, failed) == (0, [])
+    assert 'MODBUS' in order
+    for dep in ['EPICS_BASE', 'ADCORE', 'MODBUS']:
+        assert order.index(dep) < order.index('DUMMY')
+    assert order.index('EPICS_BASE') < order.index('ADCORE')
+
+
+def test_build_all_failed_dependency():
+    config, scheduling_builder, order = get_scheduling_builder()
+    config.get_module_by_name('DUMMY').dependencies = ['ADCORE']
+    scheduling_builder.build_single_module = lambda module, make_flag=None: 1 if module.name == 'ADCORE' else 0
+    ret, failed = scheduling_builder.build_all()
+    assert (ret, failed) == (2, ['ADCORE', 'DUMMY'])
+
+
+def test_build_all_ordered_failure():
+    config, scheduling_builder, order = get_scheduling_builder()
+
+    def build_single_module(module, make_flag=None):
+        order.append(module.name)
+        return 1 if module.name == 'MODBUS' else 0
+
+    scheduling_builder.build_single_module = build_single_module
+    ret, failed = scheduling_builder.build_all()
+    assert (ret, failed) == (1, ['MODBUS'])
+    assert order == ['EPICS_BASE', 'MODBUS', 'ADCORE', 'DUMMY']
+
+
+def test_build_all_circular_dependency():
+    config, scheduling_builder, order = get_scheduling_builder()
+    config.get_module_by_name('ADCORE').dependencies = ['DUMMY']
+    config.get_module_by_name('DUMMY').dependencies = ['ADCORE']
+    ret, failed = scheduling_builder.build_all()
+    assert (ret, sorted(failed)) == (2, ['ADCORE', 'DUMMY'])
+    assert order == ['EPICS_BASE', 'MODBUS']
+
+
+def test_get_max_build_workers():
+    assert Builder.BuildDriver(parsed_config, 4, one_thread=True).get_max_build_workers() == 1
+    assert Builder.BuildDriver(parsed_config, 4).get_max_build_workers() == 4
+    assert Builder.BuildDriver(parsed_config, 0).get_max_build_workers() == (Builder.os.cpu_count() or 1)
+
+
+def test_get_make_flag():
+    assert builder.get_make_flag(1) == '-s'
+    assert builder.get_make_flag(6) == '-sj6'
+
+
+def test_batch_package_installs():
+    script = ['#!/bin/bash', '', 'sudo apt-get -y update', 'sudo apt-get -y install gcc',
+              '# comment', 'sudo apt-get -y install g++ make', 'echo done', 'sudo apt-get -y install re2c']
+    assert builder.batch_package_installs(script) == ['#!/bin/bash', '', 'sudo apt-get -y update',
+                                                      'sudo apt-get -y install gcc g++ make', '# comment',
+                                                      'echo done', 'sudo apt-get -y install re2c']
+
+
+def test_check_dependencies_in_path_cached():
+    checking_builder = Builder.BuildDriver(parsed_config, 0)
+    status, message = checking_builder.check_dependencies_in_path(force_recheck=True)
+    checking_builder.dependency_check_cache[Builder.os.environ.get('PATH', '')] = (False, 'dummy')
+    assert checking_builder.check_dependencies_in_path() == (False, 'dummy')
+    assert checking_builder.check_dependencies_in_path(force_recheck=True) == (status, message)
@@ -0,0 +1,78 @@
+"""
+Unit test file for clone driver
+"""
+
+__author__      = "Jakub Wlodek"
+__copyright__   = "Copyright June 2019, Brookhaven Science Associates"
+
+
+import pytest
+import shutil
+import subprocess
+
+from installSynApps.io import config_parser as Parser
+from installSynApps.driver import clone_driver as Cloner
+
+parser = Parser.ConfigParser('tests/TestConfigs/basic')
+parsed_config, message = parser.parse_install_config(allow_illegal=True)
+cloner = Cloner.CloneDriver(parsed_config)
+
+
+def test_get_head_hash(tmpdir):
+    module = parsed_config.get_module_by_name('DUMMY')
+    old_path = module.abs_path
+    module.abs_path = str(tmpdir)
+    tmpdir.mkdir('.git').join('HEAD').write('{}\n'.format('a' * 40))
+    assert cloner.get_head_hash(module) == 'a' * 40
+    module.abs_path = old_path
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason='git is not installed')
+def test_get_head_hash_branch(tmpdir):
+    module = parsed_config.get_module_by_name('DUMMY')
+    old_path = module.abs_path
+    module.abs_path = str(tmpdir)
+    git = ['git', '-c', 'user.name=test', '-c', 'user.email=test@test', '-C', str(tmpdir)]
+    subprocess.check_call(git + ['init', '-q'])
+    subprocess.check_call(git + ['commit', '-q', '--allow-empty', '-m', 'test'])
+    head = subprocess.check_output(git + ['rev-parse', 'HEAD']).decode('utf-8').strip()
+    assert cloner.get_head_hash(module) == head
+    assert len(head) == 40
+    module.abs_path = old_path
+
+
+def test_get_clone_graph():
+    graph = cloner.get_clone_graph()
+    assert graph['EPICS_BASE'] == set()
+    assert graph['MODBUS'] == set(['SUPPORT'])
+    assert graph['ADCORE'] == set(['SUPPORT', 'AREA_DETECTOR'])
+
+
+def get_scheduling_cloner(failing_module=None):
+    config, _ = Parser.ConfigParser('tests/TestConfigs/basic').parse_install_config(allow_illegal=True)
+    scheduling_cloner = Cloner.CloneDriver(config)
+    order = []
+
+    def clone_and_checkout_module(module):
+        order.append(module.name)
+        return -1 if module.name == failing_module else 0
+
+    scheduling_cloner.clone_and_checkout_module = clone_and_checkout_module
+    return scheduling_cloner, order
+
+
+def test_clone_and_checkout_parallel_order():
+    scheduling_cloner, order = get_scheduling_cloner()
+    assert scheduling_cloner.clone_and_checkout_parallel(max_workers=4) == []
+    assert sorted(order) == ['ADCORE', 'AREA_DETECTOR', 'DUMMY', 'EPICS_BASE', 'MODBUS', 'SUPPORT']
+    for name, containers in scheduling_cloner.get_clone_graph().items():
+        for container in containers:
+            assert order.index(container) < order.index(name)
+
+
+def test_clone_and_checkout_parallel_failed_container():
+    scheduling_cloner, order = get_scheduling_cloner(failing_module='AREA_DETECTOR')
+    failed = scheduling_cloner.clone_and_checkout_parallel(max_workers=4)
+    assert sorted(failed) == ['ADCORE', 'AREA_DETECTOR', 'DUMMY']
+    assert 'ADCORE' not in order and 'DUMMY' not in order
+    assert 'MODBUS' in order
@@ -0,0 +1,34 @@
+"""
+Unit test file for installSynApps directory helper functions
+"""
+
+__author__      = "Jakub Wlodek"
+__copyright__   = "Copyright June 2019, Brookhaven Science Associates"
+
+
+import os
+import pytest
+
+import installSynApps
+
+
+def test_copy_tree_keeps_existing(tmp_path):
+    src = tmp_path / 'src'
+    (src / 'sub').mkdir(parents=True)
+    (src / 'a.sh').write_text('new')
+    (src / 'sub' / 'b.sh').write_text('b')
+    dest = tmp_path / 'dest'
+    dest.mkdir()
+    (dest / 'a.sh').write_text('old')
+    installSynApps.copy_tree(str(src), str(dest))
+    assert (dest / 'a.sh').read_text() == 'old'
+    assert (dest / 'sub' / 'b.sh').read_text() == 'b'
+
+
+def test_remove_tree(tmp_path):
+    target = tmp_path / 'target'
+    (target / 'sub').mkdir(parents=True)
+    (target / 'sub' / 'b.sh').write_text('b')
+    installSynApps.remove_tree(str(target))
+    assert not os.path.exists(str(target))
+    installSynApps.remove_tree(str(target))
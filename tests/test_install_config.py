@@ -65,4 +65,19 @@ def test_convert_path():
 def test_get_core_version():
     install_config.add_module(core_module)
     assert install_config.get_core_version() == 'R3-6'
-    reset()
\ No newline at end of file
+    reset()
+
+
+def test_relocate():
+    install_config.add_module(base_module)
+    install_config.add_module(support_module)
+    install_config.add_module(core_module)
+    install_config.add_module(ad_module)
+    assert install_config.convert_path_abs(test_module.rel_path) == '/epics/test/support/areaDetector/dummy'
+    install_config.relocate('/epics/moved')
+    assert install_config.support_path == '/epics/moved/support'
+    assert install_config.ad_path == '/epics/moved/support/areaDetector'
+    assert install_config.convert_path_abs(test_module.rel_path) == '/epics/moved/support/areaDetector/dummy'
+    assert core_module.abs_path == '/epics/moved/support/areaDetector/ADCore'
+    install_config.relocate('/epics/test')
+    reset()
@@ -5,6 +5,7 @@ Unit test file for config parser
 __author__      = "Jakub Wlodek"
 __copyright__   = "Copyright June 2019, Brookhaven Science Associates"
 
+import os
 import pytest
 import tests.helper_test_funcs as Helper
 
@@ -70,3 +71,35 @@ def test_macro_files():
     assert len(parsed_config.build_flags) == 3
     assert parsed_config.build_flags[0][0] == 'MACRO_A'
     assert parsed_config.build_flags[0][1] == 'YES'
+
+
+def test_get_configure_signature(tmpdir):
+    tmpdir.join('INSTALL_CONFIG').write('INSTALL=/tmp\n')
+    tmpdir.mkdir('macroFiles').join('BUILD_FLAG_CONFIG').write('')
+    sig_parser = Parser.ConfigParser(str(tmpdir))
+    signature = sig_parser.get_configure_signature()
+    assert [entry[0] for entry in signature] == ['INSTALL_CONFIG', os.path.join('macroFiles', 'BUILD_FLAG_CONFIG')]
+    assert sig_parser.get_configure_signature() == signature
+    tmpdir.join('INSTALL_CONFIG').write('INSTALL=/tmp/other\n')
+    assert sig_parser.get_configure_signature() != signature
+
+
+def test_get_configure_digest(tmpdir):
+    tmpdir.join('INSTALL_CONFIG').write('INSTALL=/tmp\n')
+    digest_parser = Parser.ConfigParser(str(tmpdir))
+    digest = digest_parser.get_configure_digest()
+    tmpdir.join('INSTALL_CONFIG').write('INSTALL=/tmp\n')
+    assert digest_parser.get_configure_digest() == digest
+    tmpdir.join('INSTALL_CONFIG').write('INSTALL=/tmp/other\n')
+    assert digest_parser.get_configure_digest() != digest
+
+
+def test_get_configure_digest_rehashes_modified_file(tmpdir):
+    config_file = tmpdir.join('INSTALL_CONFIG')
+    config_file.write('INSTALL=/tmp/aaa\n')
+    os.utime(str(config_file), ns=(1000000000, 1000000000))
+    digest_parser = Parser.ConfigParser(str(tmpdir))
+    digest = digest_parser.get_configure_digest()
+    config_file.write('INSTALL=/tmp/bbb\n')
+    os.utime(str(config_file), ns=(2000000000, 2000000000))
+    assert digest_parser.get_configure_digest() != digest
@@ -0,0 +1,29 @@
+"""
+Unit test file for module tag syncing
+"""
+
+__author__      = "Jakub Wlodek"
+__copyright__   = "Copyright June 2019, Brookhaven Science Associates"
+
+
+import pytest
+
+import installSynApps
+import installSynApps.data_model.install_module as IM
+
+
+def test_get_version_numbers():
+    assert installSynApps.get_version_numbers('R6-2-1') == [6, 2, 1]
+    assert installSynApps.get_version_numbers('master') == []
+
+
+def test_update_module_version_prefers_r_tags():
+    module = IM.InstallModule('ASYN', 'R4-36', '$(SUPPORT)/asyn', 'GIT_URL', 'https://github.com/dummyurl/', 'asyn', 'YES', 'YES', 'YES')
+    installSynApps.update_module_version(module, ['5-0', 'R4-37', 'R4-38', 'R4-9'])
+    assert module.version == 'R4-38'
+
+
+def test_update_module_version_keeps_newer():
+    module = IM.InstallModule('ASYN', 'R4-40', '$(SUPPORT)/asyn', 'GIT_URL', 'https://github.com/dummyurl/', 'asyn', 'YES', 'YES', 'YES')
+    installSynApps.update_module_version(module, ['R4-37', 'R4-38'])
+    assert module.version == 'R4-40'
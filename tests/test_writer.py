@@ -0,0 +1,28 @@
+"""
+Unit test file for config writer
+"""
+
+__author__      = "Jakub Wlodek"
+__copyright__   = "Copyright June 2019, Brookhaven Science Associates"
+
+
+import os
+import pytest
+
+import installSynApps.io.config_parser as Parser
+import installSynApps.io.config_writer as Writer
+
+
+def test_overwrite_replaces_injector_files(tmp_path):
+    install_config, _ = Parser.ConfigParser('configure').parse_install_config()
+    writer = Writer.ConfigWriter(install_config)
+    save_path = str(tmp_path / 'saved')
+    assert writer.write_install_config(filepath=save_path) == (True, None)
+    (tmp_path / 'saved' / 'injectionFiles' / 'STALE').write_text('stale')
+    assert writer.write_install_config(filepath=save_path, overwrite_existing=True) == (True, None)
+    injector_files = os.listdir(os.path.join(save_path, 'injectionFiles'))
+    assert 'STALE' not in injector_files
+    assert len(injector_files) == len(install_config.injector_files)
+    assert 'injectionFiles.tmp' not in os.listdir(save_path)
+    assert 'macroFiles.tmp' not in os.listdir(save_path)
+    assert os.path.isfile(os.path.join(save_path, 'macroFiles', 'BUILD_FLAG_CONFIG'))